@@ -10,9 +10,11 @@ Format reference:
 
 from __future__ import annotations
 
+import os
 import struct
 from dataclasses import dataclass
 from pathlib import Path
+from typing import BinaryIO
 
 RDAR_MAGIC = b"RDAR"
 HEADER_SIZE = 0x28  # 40 bytes
@@ -29,6 +31,10 @@ _HEADER_FMT = "<4sIQIIQQ"
 _TOC_PREAMBLE_FMT = "<IIQIII"
 _HASH_ENTRY_FMT = "<QQIIIII"  # 36 bytes; remaining 20 bytes are SHA-1
 
+_HEADER_STRUCT = struct.Struct(_HEADER_FMT)
+_TOC_PREAMBLE_STRUCT = struct.Struct(_TOC_PREAMBLE_FMT)
+_HASH_ENTRY_STRUCT = struct.Struct(_HASH_ENTRY_FMT)
+
 
 @dataclass(frozen=True, slots=True)
 class RdarHeader:
@@ -61,8 +67,8 @@ def parse_rdar_header(data: bytes) -> RdarHeader:
     magic = data[0:4]
     if magic != RDAR_MAGIC:
         raise ValueError(f"Invalid RDAR magic: {magic!r}")
-    _, version, table_offset, index, _custom_data_count, _unk, file_size = struct.unpack_from(
-        _HEADER_FMT, data, 0
+    _, version, table_offset, index, _custom_data_count, _unk, file_size = (
+        _HEADER_STRUCT.unpack_from(data, 0)
     )
     return RdarHeader(
         magic=magic,
@@ -73,50 +79,60 @@ def parse_rdar_header(data: bytes) -> RdarHeader:
     )
 
 
-def parse_rdar_toc(file_path: str | Path) -> RdarToc:
+def _read_toc(f: BinaryIO) -> tuple[RdarHeader, int, bytes]:
+    """Read the header, entry count and raw hash-entry table from *f*."""
+    header_bytes = f.read(HEADER_SIZE)
+    header = parse_rdar_header(header_bytes)
+
+    if header.table_offset > header.file_size:
+        raise ValueError(
+            f"table_offset ({header.table_offset}) exceeds file_size ({header.file_size})"
+        )
+
+    f.seek(header.table_offset)
+    toc_meta = f.read(TOC_PREAMBLE_SIZE)
+    if len(toc_meta) < TOC_PREAMBLE_SIZE:
+        raise ValueError("TOC preamble truncated")
+
+    _tbl_off, _tbl_sz, _crc, num_files, _num_segments, _num_deps = _TOC_PREAMBLE_STRUCT.unpack_from(
+        toc_meta, 0
+    )
+
+    hash_data_size = num_files * HASH_ENTRY_SIZE
+    if hash_data_size > MAX_HASH_TABLE_BYTES:
+        raise ValueError(
+            f"Unreasonable hash table size: {num_files} entries "
+            f"({hash_data_size} bytes) — file likely corrupt"
+        )
+    hash_data = f.read(hash_data_size)
+    if len(hash_data) < hash_data_size:
+        raise ValueError(
+            f"Hash entries truncated: got {len(hash_data)}, "
+            f"expected {hash_data_size} ({num_files} entries)"
+        )
+    return header, num_files, hash_data
+
+
+def parse_rdar_toc(source: str | os.PathLike[str] | BinaryIO) -> RdarToc:
     """Read an .archive file and parse its header + TOC.
 
+    *source* may be a path or an already-open binary stream (e.g.
+    ``io.BytesIO``); streams are read from their start and left open.
+
     Only reads header (40 B) + TOC preamble (28 B) + hash entries
     (56 B each).  Does NOT read file data or decompress anything.
     """
-    file_path = Path(file_path)
-    with file_path.open("rb") as f:
-        header_bytes = f.read(HEADER_SIZE)
-        header = parse_rdar_header(header_bytes)
-
-        if header.table_offset > header.file_size:
-            raise ValueError(
-                f"table_offset ({header.table_offset}) exceeds file_size ({header.file_size})"
-            )
-
-        f.seek(header.table_offset)
-        toc_meta = f.read(TOC_PREAMBLE_SIZE)
-        if len(toc_meta) < TOC_PREAMBLE_SIZE:
-            raise ValueError("TOC preamble truncated")
-
-        _tbl_off, _tbl_sz, _crc, num_files, _num_segments, _num_deps = struct.unpack_from(
-            _TOC_PREAMBLE_FMT, toc_meta, 0
-        )
-
-        hash_data_size = num_files * HASH_ENTRY_SIZE
-        if hash_data_size > MAX_HASH_TABLE_BYTES:
-            raise ValueError(
-                f"Unreasonable hash table size: {num_files} entries "
-                f"({hash_data_size} bytes) — file likely corrupt"
-            )
-        hash_data = f.read(hash_data_size)
-        if len(hash_data) < hash_data_size:
-            raise ValueError(
-                f"Hash entries truncated: got {len(hash_data)}, "
-                f"expected {hash_data_size} ({num_files} entries)"
-            )
+    if isinstance(source, (str, os.PathLike)):
+        with Path(source).open("rb") as f:
+            header, num_files, hash_data = _read_toc(f)
+    else:
+        source.seek(0)
+        header, num_files, hash_data = _read_toc(source)
 
     entries: list[RdarHashEntry] = []
     for i in range(num_files):
         offset = i * HASH_ENTRY_SIZE
-        h, ts, num_chunks, _i1, _l1, _i2, _l2 = struct.unpack_from(
-            _HASH_ENTRY_FMT, hash_data, offset
-        )
+        h, ts, num_chunks, _i1, _l1, _i2, _l2 = _HASH_ENTRY_STRUCT.unpack_from(hash_data, offset)
         sha1 = hash_data[offset + 36 : offset + 56]
         entries.append(RdarHashEntry(hash=h, timestamp=ts, num_chunks=num_chunks, sha1=sha1))
 
@@ -154,6 +154,22 @@ def _migrate_unique_indexes() -> None:
         session.commit()
 
 
+def _migrate_installed_file_indexes() -> None:
+    """Replace the single-column relative_path index with the covering path+mod index."""
+    with Session(engine) as session:
+        session.exec(  # type: ignore[arg-type]
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_installed_mod_files_path_mod "
+                "ON installed_mod_files(relative_path, installed_mod_id)"
+            )
+        )
+        existing = session.exec(text("PRAGMA index_list(installed_mod_files)")).all()  # type: ignore[arg-type]
+        if any(row[1] == "ix_installed_mod_files_relative_path" for row in existing):
+            session.exec(text("DROP INDEX IF EXISTS ix_installed_mod_files_relative_path"))  # type: ignore[arg-type]
+            logger.info("Dropped superseded index ix_installed_mod_files_relative_path")
+        session.commit()
+
+
 def _migrate_secrets_to_keyring() -> None:
     """Move plaintext API keys from SQLite to OS keyring on first run."""
     from rippermod_manager.services.keyring_service import SECRET_KEYS, set_secret
@@ -188,6 +204,7 @@ def create_db_and_tables() -> None:
 
     _migrate_missing_columns()
     _migrate_unique_indexes()
+    _migrate_installed_file_indexes()
     _migrate_secrets_to_keyring()
 
 
@@ -57,6 +57,12 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
         await shutdown_downloads()
     except Exception:
         logger.exception("Failed to shutdown downloads")
+    try:
+        from rippermod_manager.nexus.client import close_shared_client
+
+        await close_shared_client()
+    except Exception:
+        logger.exception("Failed to close Nexus HTTP client")
     try:
         from rippermod_manager.database import engine
 
@@ -0,0 +1,13 @@
+def clear_caches() -> None:
+    """Drop the memoized results of the matching helpers.
+
+    The helpers are pure, so this is only needed to bound memory or to give
+    tests a cold cache.
+    """
+    from rippermod_manager.matching import correlator, filename_parser, grouper
+
+    correlator.compute_name_score.cache_clear()
+    correlator.normalize.cache_clear()
+    grouper.normalize_name.cache_clear()
+    filename_parser.parse_mod_filename.cache_clear()
+    filename_parser._version_key.cache_clear()
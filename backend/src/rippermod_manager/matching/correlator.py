@@ -1,7 +1,13 @@
+import functools
 import logging
 import re
+from datetime import UTC, datetime
+from typing import Any
 
-import jellyfish
+import numpy as np
+from rapidfuzz import process
+from rapidfuzz.distance import JaroWinkler
+from sqlalchemy import delete, insert
 from sqlmodel import Session, select
 
 from rippermod_manager.matching.filename_parser import parse_mod_filename
@@ -72,6 +78,7 @@ def _categories_compatible(local_cat: str | None, nexus_cat: str) -> bool:
     return not (local_cat == "assets" and nexus_lower in _NEXUS_SCRIPT_CATEGORIES)
 
 
+@functools.lru_cache(maxsize=8192)
 def normalize(s: str) -> str:
     s = strip_ordering_prefix(s)
     s = split_camel(s)
@@ -80,36 +87,67 @@ def normalize(s: str) -> str:
     return s
 
 
+class _TokenVocabulary:
+    """Token -> bit index for one scoring pass; bitsets from it are comparable.
+
+    Each pass builds its own vocabulary, so the bitset width stays bounded by
+    the names scored in that pass and concurrent scans never share state.
+    """
+
+    def __init__(self) -> None:
+        self._bits: dict[str, int] = {}
+
+    def bitset(self, norm: str) -> int:
+        """Encode the tokens of an already normalized name as an int bitset."""
+        bits = 0
+        for tok in norm.split():
+            bits |= 1 << self._bits.setdefault(tok, len(self._bits))
+        return bits
+
+
 def token_jaccard(a: str, b: str) -> float:
-    tokens_a = set(normalize(a).split())
-    tokens_b = set(normalize(b).split())
-    if not tokens_a or not tokens_b:
+    vocab = _TokenVocabulary()
+    bits_a = vocab.bitset(normalize(a))
+    bits_b = vocab.bitset(normalize(b))
+    if not bits_a or not bits_b:
         return 0.0
-    intersection = tokens_a & tokens_b
-    union = tokens_a | tokens_b
-    return len(intersection) / len(union)
+    return (bits_a & bits_b).bit_count() / (bits_a | bits_b).bit_count()
 
 
-def compute_name_score(local_name: str, nexus_name: str) -> tuple[float, str]:
-    ln = normalize(local_name)
-    nn = normalize(nexus_name)
-
+def _score_normalized(
+    ln: str, nn: str, local_bits: int, nexus_bits: int, jw: float | None = None
+) -> tuple[float, str]:
+    """Score two normalized names; *jw* may come from a batched Jaro-Winkler pass."""
     if ln == nn:
         return 1.0, "exact"
 
     if ln in nn or nn in ln:
         return 0.9, "substring"
 
-    jaccard = token_jaccard(local_name, nexus_name)
-    if jaccard == 0.0:
+    shared = (local_bits & nexus_bits).bit_count()
+    if not shared:
         return 0.0, "fuzzy"
+    jaccard = shared / (local_bits | nexus_bits).bit_count()
 
-    jw = jellyfish.jaro_winkler_similarity(ln, nn)
+    if jw is None:
+        jw = JaroWinkler.similarity(ln, nn)
     combined = 0.5 * jaccard + 0.5 * jw
 
     return round(combined, 3), "fuzzy"
 
 
+# Pair scores are pure; the purge pass and the collection/requirement/file-list
+# matchers re-score the same (group, Nexus name) pairs on every run.
+@functools.lru_cache(maxsize=10_000)
+def compute_name_score(local_name: str, nexus_name: str) -> tuple[float, str]:
+    if local_name == nexus_name:
+        return 1.0, "exact"
+    ln = normalize(local_name)
+    nn = normalize(nexus_name)
+    vocab = _TokenVocabulary()
+    return _score_normalized(ln, nn, vocab.bitset(ln), vocab.bitset(nn))
+
+
 def _dedup_correlations(groups: list[ModGroup], session: Session) -> int:
     """Remove duplicate correlations pointing to the same nexus_mod_id.
 
@@ -135,7 +173,7 @@ def _dedup_correlations(groups: list[ModGroup], session: Session) -> int:
 
     group_file_counts: dict[int, int] = {g.id: len(g.files) for g in groups if g.id is not None}
 
-    purged = 0
+    stale_ids: list[int] = []
     for nexus_id, entries in by_nexus.items():
         if len(entries) <= 1:
             continue
@@ -156,12 +194,34 @@ def _dedup_correlations(groups: list[ModGroup], session: Session) -> int:
                 nexus_id,
                 corr.score,
             )
-            session.delete(corr)
-            purged += 1
+            stale_ids.append(corr.id)  # type: ignore[arg-type]
 
-    if purged:
-        logger.info("Dedup: removed %d duplicate correlations", purged)
-    return purged
+    if stale_ids:
+        session.exec(
+            delete(ModNexusCorrelation).where(ModNexusCorrelation.id.in_(stale_ids))  # type: ignore[union-attr]
+        )
+        logger.info("Dedup: removed %d duplicate correlations", len(stale_ids))
+    return len(stale_ids)
+
+
+def _filename_nexus_id(group: ModGroup, nexus_id_map: dict[int, NexusDownload]) -> int | None:
+    """Return the first Nexus mod ID parsed from *group*'s filenames that has a download."""
+    for f in group.files:
+        parsed = parse_mod_filename(f.filename)
+        if parsed.nexus_mod_id and parsed.nexus_mod_id in nexus_id_map:
+            return parsed.nexus_mod_id
+    return None
+
+
+def _fuzzy_candidates(
+    group_norm: str, dl_norms: list[str], dl_by_token: dict[str, list[int]]
+) -> list[int]:
+    """Indices of downloads sharing a token with *group_norm* or substring-matching it."""
+    candidates = {j for tok in set(group_norm.split()) for j in dl_by_token.get(tok, ())}
+    candidates.update(
+        j for j, norm in enumerate(dl_norms) if norm in group_norm or group_norm in norm
+    )
+    return sorted(candidates)
 
 
 def correlate_game_mods(game: Game, session: Session) -> CorrelateResult:
@@ -184,16 +244,16 @@ def correlate_game_mods(game: Game, session: Session) -> CorrelateResult:
     _NAME_METHODS = {"exact", "substring", "fuzzy"}
     dl_map: dict[int, NexusDownload] = {dl.id: dl for dl in downloads if dl.id is not None}
     group_map: dict[int, ModGroup] = {g.id: g for g in groups if g.id is not None}
-    purged = 0
-    for corr in list(existing):
+    stale_ids: list[int] = []
+    kept: list[ModNexusCorrelation] = []
+    for corr in existing:
         if corr.confirmed_by_user or corr.method not in _NAME_METHODS:
+            kept.append(corr)
             continue
         grp = group_map.get(corr.mod_group_id)
         dl = dl_map.get(corr.nexus_download_id)
         if not grp or not dl:
-            session.delete(corr)
-            existing.remove(corr)
-            purged += 1
+            stale_ids.append(corr.id)  # type: ignore[arg-type]
             continue
         score, _ = compute_name_score(grp.display_name, dl.mod_name)
         if score < 0.4:
@@ -205,11 +265,19 @@ def correlate_game_mods(game: Game, session: Session) -> CorrelateResult:
                 corr.score,
                 score,
             )
-            session.delete(corr)
-            existing.remove(corr)
-            purged += 1
-    if purged:
-        logger.info("Purged %d stale name-based correlations", purged)
+            stale_ids.append(corr.id)  # type: ignore[arg-type]
+            continue
+        kept.append(corr)
+    existing = kept
+    if stale_ids:
+        session.exec(
+            delete(ModNexusCorrelation).where(ModNexusCorrelation.id.in_(stale_ids))  # type: ignore[union-attr]
+        )
+        logger.info("Purged %d stale name-based correlations", len(stale_ids))
+
+    # New correlations are collected as rows and bulk-inserted in one statement
+    now = datetime.now(UTC)
+    new_corrs: list[dict[str, Any]] = []
 
     already_matched: set[int] = set()
     already_matched_nexus_ids: set[int] = set()
@@ -261,15 +329,17 @@ def correlate_game_mods(game: Game, session: Session) -> CorrelateResult:
         dl = nexus_id_map.get(im.nexus_mod_id)  # type: ignore[arg-type]
         if not dl:
             continue
-        corr = ModNexusCorrelation(
-            mod_group_id=im.mod_group_id,  # type: ignore[arg-type]
-            nexus_download_id=dl.id,  # type: ignore[arg-type]
-            score=1.0,
-            method="installed",
-            reasoning=f"Auto-correlated from installed mod '{im.name}'",
-            confirmed_by_user=True,
+        new_corrs.append(
+            {
+                "mod_group_id": im.mod_group_id,
+                "nexus_download_id": dl.id,
+                "score": 1.0,
+                "method": "installed",
+                "reasoning": f"Auto-correlated from installed mod '{im.name}'",
+                "confirmed_by_user": True,
+                "created_at": now,
+            }
         )
-        session.add(corr)
         already_matched.add(im.mod_group_id)  # type: ignore[arg-type]
         already_matched_nexus_ids.add(dl.nexus_mod_id)
         logger.info(
@@ -279,6 +349,59 @@ def correlate_game_mods(game: Game, session: Session) -> CorrelateResult:
             im.name,
         )
 
+    # Normalize every name once up front
+    dl_norms = [normalize(dl.mod_name) for dl in downloads]
+    vocab = _TokenVocabulary()
+    dl_bits = [vocab.bitset(norm) for norm in dl_norms]
+    # Plain list so the pair loop avoids ORM attribute instrumentation
+    dl_nexus_ids = [dl.nexus_mod_id for dl in downloads]
+
+    # Inverted index of download tokens. A pair that shares no token and is
+    # not a substring match scores 0 and can never be selected, so the fuzzy
+    # loop only visits downloads found here or by the substring scan.
+    dl_by_token: dict[str, list[int]] = {}
+    for j, norm in enumerate(dl_norms):
+        for tok in set(norm.split()):
+            dl_by_token.setdefault(tok, []).append(j)
+
+    pending = [g for g in groups if g.id not in already_matched]
+    group_norms = {g.id: normalize(g.display_name) for g in pending}
+    filename_ids = {g.id: _filename_nexus_id(g, nexus_id_map) for g in pending}
+
+    # Batch Jaro-Winkler into one C-level cpdist call over just the
+    # fuzzy candidates of groups the filename-ID fast path will not
+    # resolve, so memory scales with candidates instead of groups x downloads.
+    candidates_by_group: dict[int, list[int]] = {}
+    pair_groups: list[str] = []
+    pair_downloads: list[str] = []
+    for g in pending:
+        nexus_id = filename_ids[g.id]
+        if nexus_id is not None and nexus_id not in already_matched_nexus_ids:
+            continue
+        group_norm = group_norms[g.id]
+        candidates = _fuzzy_candidates(group_norm, dl_norms, dl_by_token)
+        candidates_by_group[g.id] = candidates  # type: ignore[index]
+        pair_groups.extend([group_norm] * len(candidates))
+        pair_downloads.extend(dl_norms[j] for j in candidates)
+    pair_scores = (
+        process.cpdist(
+            pair_groups,
+            pair_downloads,
+            scorer=JaroWinkler.similarity,
+            dtype=np.float64,
+            workers=-1,
+        ).tolist()
+        if pair_groups
+        else []
+    )
+    jw_by_group: dict[int, dict[int, float]] = {}
+    offset = 0
+    for group_id, candidates in candidates_by_group.items():
+        jw_by_group[group_id] = dict(
+            zip(candidates, pair_scores[offset : offset + len(candidates)], strict=True)
+        )
+        offset += len(candidates)
+
     matched = 0
     for group in groups:
         if group.id in already_matched:
@@ -289,27 +412,33 @@ def correlate_game_mods(game: Game, session: Session) -> CorrelateResult:
         best_download: NexusDownload | None = None
         best_method = ""
 
-        # Fast path: try to match via Nexus mod ID parsed from filenames
-        _ = group.files
-        for f in group.files:
-            parsed = parse_mod_filename(f.filename)
-            if parsed.nexus_mod_id and parsed.nexus_mod_id in nexus_id_map:
-                dl_candidate = nexus_id_map[parsed.nexus_mod_id]
-                if dl_candidate.nexus_mod_id not in already_matched_nexus_ids:
-                    best_download = dl_candidate
-                    best_score = 0.95
-                    best_method = "filename_id"
-                break
+        # Fast path: match via the Nexus mod ID parsed from filenames
+        nexus_id = filename_ids[group.id]
+        if nexus_id is not None and nexus_id not in already_matched_nexus_ids:
+            best_download = nexus_id_map[nexus_id]
+            best_score = 0.95
+            best_method = "filename_id"
 
         # Slow path: fuzzy name matching with category penalty + popularity tiebreaker
         if not best_download:
             local_cat = group_category_map.get(group.id)  # type: ignore[arg-type]
-            for dl in downloads:
-                if dl.nexus_mod_id in already_matched_nexus_ids:
+            group_norm = group_norms[group.id]
+            group_bits = vocab.bitset(group_norm)
+            # A group whose filename ID was claimed earlier in this loop has no
+            # batched scores; _score_normalized then computes Jaro-Winkler itself.
+            jw_scores = jw_by_group.get(group.id, {})  # type: ignore[arg-type]
+            candidates = candidates_by_group.get(group.id)  # type: ignore[arg-type]
+            if candidates is None:
+                candidates = _fuzzy_candidates(group_norm, dl_norms, dl_by_token)
+            for j in candidates:
+                nexus_mod_id = dl_nexus_ids[j]
+                if nexus_mod_id in already_matched_nexus_ids:
                     continue
-                score, method = compute_name_score(group.display_name, dl.mod_name)
+                score, method = _score_normalized(
+                    group_norm, dl_norms[j], group_bits, dl_bits[j], jw_scores.get(j)
+                )
                 # Apply category penalty for incompatible types
-                nexus_cat = nexus_category_map.get(dl.nexus_mod_id, "")
+                nexus_cat = nexus_category_map.get(nexus_mod_id, "")
                 if score > 0 and not _categories_compatible(local_cat, nexus_cat):
                     score = max(0.0, score - _CATEGORY_PENALTY)
                 is_better = score > best_score
@@ -317,12 +446,12 @@ def correlate_game_mods(game: Game, session: Session) -> CorrelateResult:
                     best_download is not None
                     and score > 0
                     and abs(score - best_score) < 0.05
-                    and endorsement_map.get(dl.nexus_mod_id, 0)
+                    and endorsement_map.get(nexus_mod_id, 0)
                     > endorsement_map.get(best_download.nexus_mod_id, 0)
                 )
                 if is_better or is_tiebreak:
                     best_score = score
-                    best_download = dl
+                    best_download = downloads[j]
                     best_method = method
 
         if best_download and best_score >= 0.4:
@@ -334,21 +463,27 @@ def correlate_game_mods(game: Game, session: Session) -> CorrelateResult:
                     best_download.mod_name,
                     best_method,
                 )
-            corr = ModNexusCorrelation(
-                mod_group_id=group.id,  # type: ignore[arg-type]
-                nexus_download_id=best_download.id,  # type: ignore[arg-type]
-                score=best_score,
-                method=best_method,
-                reasoning=(
-                    f"Matched '{group.display_name}' "
-                    f"-> '{best_download.mod_name}' "
-                    f"via {best_method}"
-                ),
+            new_corrs.append(
+                {
+                    "mod_group_id": group.id,
+                    "nexus_download_id": best_download.id,
+                    "score": best_score,
+                    "method": best_method,
+                    "reasoning": (
+                        f"Matched '{group.display_name}' "
+                        f"-> '{best_download.mod_name}' "
+                        f"via {best_method}"
+                    ),
+                    "confirmed_by_user": False,
+                    "created_at": now,
+                }
             )
-            session.add(corr)
             already_matched_nexus_ids.add(best_download.nexus_mod_id)
             matched += 1
 
+    if new_corrs:
+        session.exec(insert(ModNexusCorrelation), params=new_corrs)
+
     # Deduplicate: if multiple groups point to the same nexus_mod_id, keep best
     _dedup_correlations(groups, session)
 
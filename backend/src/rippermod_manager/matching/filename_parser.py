@@ -9,6 +9,7 @@ This module provides a fast heuristic that can skip expensive ML-based
 matching when the filename already encodes the Nexus mod ID.
 """
 
+import functools
 import re
 from dataclasses import dataclass
 
@@ -47,7 +48,12 @@ _NEXUS_ALPHA_RE = re.compile(
 # Examples: "107-CyberEngineTweaks", "12345_SomeMod"
 _SIMPLE_RE = re.compile(r"^(\d+)[-_](.+)$")
 
+# Version parsing: segment separators and the leading numeric part of a segment
+_VERSION_SEP_RE = re.compile(r"[.\-_]")
+_VERSION_PART_RE = re.compile(r"^(\d+)(.*)$")
 
+
+@functools.lru_cache(maxsize=4096)
 def parse_mod_filename(filename: str) -> ParsedFilename:
     """Parse a mod archive filename and extract Nexus metadata.
 
@@ -107,11 +113,11 @@ def parse_version(version_str: str) -> list[tuple[int, str]]:
     if not version_str:
         return []
 
-    parts = re.split(r"[.\-_]", version_str.lower().strip())
+    parts = _VERSION_SEP_RE.split(version_str.lower().strip())
     result: list[tuple[int, str]] = []
 
     for part in parts:
-        m = re.match(r"^(\d+)(.*)$", part)
+        m = _VERSION_PART_RE.match(part)
         if m:
             result.append((int(m.group(1)), m.group(2)))
         elif part:
@@ -120,6 +126,16 @@ def parse_version(version_str: str) -> list[tuple[int, str]]:
     return result
 
 
+# Per-part sort key: (number, is_release, suffix). A bare number sorts above the
+# same number with a suffix, so 1.0 > 1.0-beta; suffixes compare as strings.
+_ZERO_PART = (0, True, "")
+
+
+@functools.lru_cache(maxsize=4096)
+def _version_key(version_str: str) -> tuple[tuple[int, bool, str], ...]:
+    return tuple((num, not suffix, suffix) for num, suffix in parse_version(version_str))
+
+
 def is_newer_version(latest: str, installed: str) -> bool:
     """Return True if *latest* is strictly newer than *installed*.
 
@@ -130,32 +146,16 @@ def is_newer_version(latest: str, installed: str) -> bool:
     are compared lexicographically, which works for single-letter tags but
     may mis-order multi-character labels (e.g. ``alpha`` vs ``beta``).
     """
-    latest_parts = parse_version(latest)
-    installed_parts = parse_version(installed)
+    latest_key = _version_key(latest)
+    installed_key = _version_key(installed)
 
-    if not latest_parts or not installed_parts:
+    if not latest_key or not installed_key:
         return latest != installed
 
-    max_len = max(len(latest_parts), len(installed_parts))
-    while len(latest_parts) < max_len:
-        latest_parts.append((0, ""))
-    while len(installed_parts) < max_len:
-        installed_parts.append((0, ""))
-
-    for (lat_num, lat_str), (inst_num, inst_str) in zip(
-        latest_parts, installed_parts, strict=False
-    ):
-        if lat_num > inst_num:
-            return True
-        if lat_num < inst_num:
-            return False
-        if lat_str == "" and inst_str != "":
-            return True
-        if lat_str != "" and inst_str == "":
-            return False
-        if lat_str > inst_str:
-            return True
-        if lat_str < inst_str:
-            return False
-
-    return False
+    # Missing trailing parts count as ".0" so that 1.0 == 1.0.0
+    pad = len(latest_key) - len(installed_key)
+    if pad > 0:
+        installed_key += (_ZERO_PART,) * pad
+    elif pad < 0:
+        latest_key += (_ZERO_PART,) * -pad
+    return latest_key > installed_key
@@ -1,3 +1,4 @@
+import functools
 import re
 
 import numpy as np
@@ -6,9 +7,8 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
 from rippermod_manager.matching.normalization import (
-    SEPARATOR_RE,
+    WORD_BOUNDARY_RE,
     clean_display_name,
-    split_camel,
     strip_ordering_prefix,
 )
 from rippermod_manager.models.mod import ModFile
@@ -16,12 +16,12 @@ from rippermod_manager.models.mod import ModFile
 VERSION_RE = re.compile(r"[_\-.]?v?\d+\.\d+(\.\d+)?[_\-.]?", re.IGNORECASE)
 
 
+@functools.lru_cache(maxsize=8192)
 def normalize_name(name: str) -> str:
     name = strip_ordering_prefix(name)
     name = name.rsplit(".", 1)[0]
     name = VERSION_RE.sub(" ", name)
-    name = split_camel(name)
-    name = SEPARATOR_RE.sub(" ", name)
+    name = WORD_BOUNDARY_RE.sub(" ", name)
     return name.strip().lower()
 
 
@@ -81,10 +81,9 @@ def _cluster_loose_files(
         group_name = longest_stem.title() if longest_stem else cluster_files[0].filename
 
         if len(indices) > 1:
-            sub_sims = [
-                sim_matrix[i][j] for idx_i, i in enumerate(indices) for j in indices[idx_i + 1 :]
-            ]
-            confidence = float(np.mean(sub_sims)) if sub_sims else 1.0
+            # Mean pairwise similarity over the cluster's upper triangle
+            block = sim_matrix[np.ix_(indices, indices)]
+            confidence = float(np.mean(block[np.triu_indices(len(indices), k=1)]))
         else:
             confidence = 1.0
 
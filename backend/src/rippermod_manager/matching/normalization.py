@@ -5,6 +5,9 @@ import re
 SEPARATOR_RE = re.compile(r"[_\-.\s]+")
 CAMEL_RE = re.compile(r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
 ORDER_PREFIX_RE = re.compile(r"^#+|^z(?=[A-Z])")
+# Separator runs and CamelCase boundaries in one pattern, so callers that need
+# both can split or substitute in a single regex pass.
+WORD_BOUNDARY_RE = re.compile(SEPARATOR_RE.pattern + "|" + CAMEL_RE.pattern)
 
 # Words that should stay uppercase in display names
 _ACRONYMS = frozenset(
@@ -59,15 +62,10 @@ def clean_display_name(raw: str) -> str:
     >>> clean_display_name("##########VendorsXL")
     'Vendors XL'
     """
-    name = strip_ordering_prefix(raw)
-    name = split_camel(name)
-    words = SEPARATOR_RE.split(name)
     result: list[str] = []
-    for w in words:
+    for w in WORD_BOUNDARY_RE.split(strip_ordering_prefix(raw)):
         if not w:
             continue
-        if w.upper() in _ACRONYMS:
-            result.append(w.upper())
-        else:
-            result.append(w[0].upper() + w[1:] if len(w) > 1 else w.upper())
+        upper = w.upper()
+        result.append(upper if upper in _ACRONYMS else w[0].upper() + w[1:])
     return " ".join(result)
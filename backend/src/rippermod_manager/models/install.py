@@ -1,6 +1,6 @@
 from datetime import UTC, datetime
 
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -29,10 +29,14 @@ class InstalledMod(SQLModel, table=True):
 
 class InstalledModFile(SQLModel, table=True):
     __tablename__ = "installed_mod_files"
+    # Covers path -> owning mod lookups (scanner linking, conflict and load-order queries)
+    __table_args__ = (
+        Index("ix_installed_mod_files_path_mod", "relative_path", "installed_mod_id"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     installed_mod_id: int = Field(foreign_key="installed_mods.id", index=True)
-    relative_path: str = Field(index=True)
+    relative_path: str
 
     installed_mod: InstalledMod | None = Relationship(back_populates="files")
 
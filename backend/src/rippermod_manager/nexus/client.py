@@ -1,6 +1,8 @@
 import asyncio
 import logging
+import weakref
 from collections.abc import Callable
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from pathlib import Path
 from types import TracebackType
 from typing import Any, Self
@@ -16,6 +18,37 @@ BASE_URL = "https://api.nexusmods.com"
 
 _STREAM_CHUNK_SIZE = 65_536  # 64 KB
 
+# One pooled client per event loop, shared by every NexusClient on that loop so
+# consecutive ``async with NexusClient(...)`` blocks reuse open connections.
+# Keyed by loop because httpx connections cannot move between event loops.
+# Code that runs a private loop must await close_shared_client() before closing it.
+_shared_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            headers={"Accept": "application/json"},
+            timeout=90.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=32),
+            # Clients for different API keys share this pool; never persist cookies.
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+        _shared_clients[loop] = client
+    return client
+
+
+async def close_shared_client() -> None:
+    """Close the pooled client belonging to the running event loop, if any."""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 class NexusRateLimitError(Exception):
     def __init__(self, hourly_remaining: int, daily_remaining: int, reset: str) -> None:
@@ -58,11 +91,7 @@ class NexusClient:
         return self._api_key
 
     async def __aenter__(self) -> Self:
-        self._client = httpx.AsyncClient(
-            base_url=BASE_URL,
-            headers={"APIKEY": self._api_key, "Accept": "application/json"},
-            timeout=90.0,
-        )
+        self._client = _get_shared_client()
         return self
 
     async def __aexit__(
@@ -71,8 +100,8 @@ class NexusClient:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        if self._client:
-            await self._client.aclose()
+        # The pooled client outlives this instance; just drop the reference.
+        self._client = None
 
     @property
     def client(self) -> httpx.AsyncClient:
@@ -104,7 +133,7 @@ class NexusClient:
         path: str,
         data: dict[str, Any] | None = None,
     ) -> Any:
-        resp = await self.client.request(method, path, json=data)
+        resp = await self.client.request(method, path, json=data, headers={"APIKEY": self._api_key})
         self._check_rate_limit(resp)
         resp.raise_for_status()
         return resp.json()
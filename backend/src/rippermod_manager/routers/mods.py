@@ -13,6 +13,7 @@ from rippermod_manager.models.correlation import ModNexusCorrelation
 from rippermod_manager.models.game import Game
 from rippermod_manager.models.mod import ModGroup
 from rippermod_manager.models.nexus import NexusDownload, NexusModMeta
+from rippermod_manager.nexus.client import close_shared_client
 from rippermod_manager.schemas.mod import (
     CorrelateResult,
     CorrelationBrief,
@@ -330,6 +331,7 @@ def scan_mods_stream(game_name: str, body: ScanStreamRequest | None = None) -> S
                 try:
                     loop.run_until_complete(_run_async_pipeline())
                 finally:
+                    loop.run_until_complete(close_shared_client())
                     loop.close()
         except Exception:
             logger.exception("Scan failed for game '%s'", game_name)
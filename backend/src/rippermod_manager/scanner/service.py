@@ -1,4 +1,6 @@
+import itertools
 import logging
+from collections import Counter
 from pathlib import Path
 
 import xxhash
@@ -31,6 +33,9 @@ INTERESTING_EXTENSIONS = {
 
 SKIP_DIRS = {"__pycache__", ".git", "node_modules", ".vscode"}
 
+# Paths per IN (...) lookup; stays below SQLite's bound-parameter limit (999 on old builds)
+_PATH_QUERY_BATCH = 900
+
 
 def compute_hash(file_path: Path) -> str:
     h = xxhash.xxh64()
@@ -110,16 +115,32 @@ def scan_game_mods(
     ungrouped = [f for f in discovered_files if f.mod_group_id is None]
     groups = group_mod_files(ungrouped)
 
-    groups_created = 0
-    for group_name, files, confidence in groups:
-        mod_group = ModGroup(
+    # Insert every group in one flush so ids are assigned together
+    mod_groups = [
+        ModGroup(
             game_id=game.id,  # type: ignore[arg-type]
             display_name=group_name,
             confidence=confidence,
         )
-        session.add(mod_group)
-        session.flush()
+        for group_name, _files, confidence in groups
+    ]
+    session.add_all(mod_groups)
+    session.flush()
 
+    # Installed-mod owners of every grouped path, looked up in fixed-size batches
+    owners_by_path: dict[str, list[int]] = {}
+    all_paths = sorted({f.file_path for _name, files, _conf in groups for f in files})
+    for batch in itertools.batched(all_paths, _PATH_QUERY_BATCH):
+        rows = session.exec(
+            select(InstalledModFile.relative_path, InstalledModFile.installed_mod_id).where(
+                InstalledModFile.relative_path.in_(batch)  # type: ignore[union-attr]
+            )
+        ).all()
+        for rel_path, im_id in rows:
+            owners_by_path.setdefault(rel_path, []).append(im_id)
+
+    groups_created = 0
+    for mod_group, (group_name, files, _conf) in zip(mod_groups, groups, strict=True):
         for f in files:
             f.mod_group_id = mod_group.id
             session.add(f)
@@ -129,15 +150,10 @@ def scan_game_mods(
         # Link to installed mod by file overlap
         group_paths = {f.file_path for f in files}
         if group_paths:
-            overlap_rows = session.exec(
-                select(InstalledModFile.installed_mod_id).where(
-                    InstalledModFile.relative_path.in_(group_paths)
-                )  # type: ignore[union-attr]
-            ).all()
-            if overlap_rows:
-                from collections import Counter
-
-                counts = Counter(overlap_rows)
+            counts = Counter(
+                im_id for path in group_paths for im_id in owners_by_path.get(path, ())
+            )
+            if counts:
                 best_im_id, best_count = counts.most_common(1)[0]
                 if best_count > len(group_paths) * 0.5:
                     im = session.get(InstalledMod, best_im_id)
@@ -1,6 +1,6 @@
-import zipfile
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
+
+import pytest
 
 from rippermod_manager.agents.orchestrator import (
     _generate_suggestions,
@@ -9,15 +9,11 @@ from rippermod_manager.agents.orchestrator import (
     list_all_games,
     search_local_mods,
 )
-from rippermod_manager.models.install import InstalledMod, InstalledModFile
 from rippermod_manager.models.mod import ModFile, ModGroup
 from rippermod_manager.models.nexus import NexusModMeta
 
-
-def _make_zip(path: Path, files: dict[str, bytes]) -> None:
-    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED) as zf:
-        for name, content in files.items():
-            zf.writestr(name, content)
+# These tools read ``orchestrator.engine``, which the session fixture monkeypatches.
+pytestmark = pytest.mark.xdist_group("orchestrator_engine")
 
 
 class TestGenerateSuggestions:
@@ -41,6 +37,11 @@ class TestGenerateSuggestions:
         result = _generate_suggestions("scan mods and updates", "Game")
         assert len(result) <= 3
 
+    def test_deterministic(self):
+        assert _generate_suggestions("scan my mods", None) == _generate_suggestions(
+            "scan my mods", None
+        )
+
 
 class TestSearchLocalMods:
     def test_no_match(self, session):
@@ -102,72 +103,24 @@ class TestCheckModConflicts:
         result = check_mod_conflicts.invoke({"game_name": "NoSuchGame"})
         assert "not found" in result
 
-    def test_no_conflicts(self, session, make_game, tmp_path):
+    def test_no_conflicts(self, session, make_game, make_installed_mod, tmp_path):
         game = make_game(install_path=str(tmp_path / "game"))
-        game_dir = Path(game.install_path)
-        game_dir.mkdir(parents=True, exist_ok=True)
-        staging = game_dir / "downloaded_mods"
-        staging.mkdir()
-
-        _make_zip(staging / "A.zip", {"archive/pc/mod/a.archive": b"a"})
-        mod = InstalledMod(
-            game_id=game.id,
-            name="A",
-            source_archive="A.zip",
-        )
-        session.add(mod)
-        session.flush()
-        session.add(
-            InstalledModFile(
-                installed_mod_id=mod.id,
-                relative_path="archive/pc/mod/a.archive",
-            )
-        )
+        make_installed_mod(game, "A", "A.zip", {"archive/pc/mod/a.archive": b"a"})
         session.commit()
 
         result = check_mod_conflicts.invoke({"game_name": game.name})
         assert "No conflicts" in result
 
-    def test_detects_conflicts(self, session, make_game, tmp_path):
+    def test_detects_conflicts(self, session, make_game, make_installed_mod, tmp_path):
         game = make_game(install_path=str(tmp_path / "game"))
-        game_dir = Path(game.install_path)
-        game_dir.mkdir(parents=True, exist_ok=True)
-        staging = game_dir / "downloaded_mods"
-        staging.mkdir()
-
         t1 = datetime(2024, 1, 1, tzinfo=UTC)
         t2 = t1 + timedelta(hours=1)
 
-        _make_zip(staging / "A.zip", {"archive/pc/mod/shared.archive": b"a"})
-        mod_a = InstalledMod(
-            game_id=game.id,
-            name="ModA",
-            source_archive="A.zip",
-            installed_at=t1,
-        )
-        session.add(mod_a)
-        session.flush()
-        session.add(
-            InstalledModFile(
-                installed_mod_id=mod_a.id,
-                relative_path="archive/pc/mod/shared.archive",
-            )
-        )
-
-        _make_zip(staging / "B.zip", {"archive/pc/mod/shared.archive": b"b"})
-        mod_b = InstalledMod(
-            game_id=game.id,
-            name="ModB",
-            source_archive="B.zip",
-            installed_at=t2,
+        make_installed_mod(
+            game, "ModA", "A.zip", {"archive/pc/mod/shared.archive": b"a"}, installed_at=t1
         )
-        session.add(mod_b)
-        session.flush()
-        session.add(
-            InstalledModFile(
-                installed_mod_id=mod_b.id,
-                relative_path="archive/pc/mod/shared.archive",
-            )
+        make_installed_mod(
+            game, "ModB", "B.zip", {"archive/pc/mod/shared.archive": b"b"}, installed_at=t2
         )
         session.commit()
 
@@ -176,42 +129,10 @@ class TestCheckModConflicts:
         assert "ModA" in result
         assert "ModB" in result
 
-    def test_pairwise_mode(self, session, make_game, tmp_path):
+    def test_pairwise_mode(self, session, make_game, make_installed_mod, tmp_path):
         game = make_game(install_path=str(tmp_path / "game"))
-        game_dir = Path(game.install_path)
-        game_dir.mkdir(parents=True, exist_ok=True)
-        staging = game_dir / "downloaded_mods"
-        staging.mkdir()
-
-        _make_zip(staging / "A.zip", {"archive/pc/mod/x.archive": b"a"})
-        mod_a = InstalledMod(
-            game_id=game.id,
-            name="AlphaMod",
-            source_archive="A.zip",
-        )
-        session.add(mod_a)
-        session.flush()
-        session.add(
-            InstalledModFile(
-                installed_mod_id=mod_a.id,
-                relative_path="archive/pc/mod/x.archive",
-            )
-        )
-
-        _make_zip(staging / "B.zip", {"archive/pc/mod/x.archive": b"b"})
-        mod_b = InstalledMod(
-            game_id=game.id,
-            name="BetaMod",
-            source_archive="B.zip",
-        )
-        session.add(mod_b)
-        session.flush()
-        session.add(
-            InstalledModFile(
-                installed_mod_id=mod_b.id,
-                relative_path="archive/pc/mod/x.archive",
-            )
-        )
+        make_installed_mod(game, "AlphaMod", "A.zip", {"archive/pc/mod/x.archive": b"a"})
+        make_installed_mod(game, "BetaMod", "B.zip", {"archive/pc/mod/x.archive": b"b"})
         session.commit()
 
         result = check_mod_conflicts.invoke(
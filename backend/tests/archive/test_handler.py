@@ -1,6 +1,7 @@
 import zipfile
 
 import pytest
+from fixtures.zip_blobs import zip_bytes
 
 from rippermod_manager.archive.handler import (
     ArchiveEntry,
@@ -11,9 +12,7 @@ from rippermod_manager.archive.handler import (
 
 def _make_zip(path, files: dict[str, bytes]) -> None:
     """Create a zip archive with the given filename -> content mapping."""
-    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED) as zf:
-        for name, content in files.items():
-            zf.writestr(name, content)
+    path.write_bytes(zip_bytes(files))
 
 
 class TestZipHandler:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 import struct
 
 import pytest
@@ -15,6 +16,13 @@ from rippermod_manager.archive.rdar_parser import (
     parse_rdar_toc,
 )
 
+# Header: magic version table_offset index custom_data_count unk file_size
+_HDR = struct.Struct("<4sIQIIQQ")
+# TOC: tbl_off tbl_sz crc entry_count seg_count dep_count
+_TOC = struct.Struct("<IIQIII")
+# Hash entry: hash timestamp num_chunks + 4 unused u32 (SHA-1 appended separately)
+_ENT = struct.Struct("<QQIIIII")
+
 
 def build_rdar_binary(entries: list[tuple[int, bytes]]) -> bytes:
     """Build a minimal valid RDAR .archive binary for testing.
@@ -26,23 +34,18 @@ def build_rdar_binary(entries: list[tuple[int, bytes]]) -> bytes:
     num_entries = len(entries)
     file_size = HEADER_SIZE + TOC_PREAMBLE_SIZE + num_entries * HASH_ENTRY_SIZE
 
-    # Header: magic version table_offset index custom_data_count unk file_size
-    header = struct.pack("<4sIQIIQQ", RDAR_MAGIC, 12, table_offset, 1, 0, 0, file_size)
+    header = _HDR.pack(RDAR_MAGIC, 12, table_offset, 1, 0, 0, file_size)
 
-    # TOC: tbl_off tbl_sz crc entry_count seg_count dep_count
-    toc_meta = struct.pack("<IIQIII", 0, 0, 0, num_entries, 0, 0)
+    toc_meta = _TOC.pack(0, 0, 0, num_entries, 0, 0)
 
-    hash_data = b""
-    for h, sha1 in entries:
-        entry = struct.pack("<QQIIIII", h, 0, 1, 0, 0, 0, 0) + sha1
-        hash_data += entry
+    hash_data = b"".join(_ENT.pack(h, 0, 1, 0, 0, 0, 0) + sha1 for h, sha1 in entries)
 
     return header + toc_meta + hash_data
 
 
 class TestParseRdarHeader:
     def test_valid_header(self):
-        data = struct.pack("<4sIQIIQQ", RDAR_MAGIC, 12, 0x100, 42, 0, 0, 999)
+        data = _HDR.pack(RDAR_MAGIC, 12, 0x100, 42, 0, 0, 999)
         hdr = parse_rdar_header(data)
         assert hdr.magic == RDAR_MAGIC
         assert hdr.version == 12
@@ -51,7 +54,7 @@ class TestParseRdarHeader:
         assert hdr.file_size == 999
 
     def test_invalid_magic_raises(self):
-        data = struct.pack("<4sIQIIQQ", b"NOPE", 12, 0, 0, 0, 0, 0)
+        data = _HDR.pack(b"NOPE", 12, 0, 0, 0, 0, 0)
         with pytest.raises(ValueError, match="Invalid RDAR magic"):
             parse_rdar_header(data)
 
@@ -61,11 +64,10 @@ class TestParseRdarHeader:
 
 
 class TestParseRdarToc:
-    def test_single_entry(self, tmp_path):
+    def test_single_entry(self):
         sha1 = b"\xab" * 20
         data = build_rdar_binary([(0xDEADBEEF, sha1)])
-        archive = tmp_path / "test.archive"
-        archive.write_bytes(data)
+        archive = io.BytesIO(data)
 
         toc = parse_rdar_toc(archive)
         assert len(toc.hash_entries) == 1
@@ -73,11 +75,10 @@ class TestParseRdarToc:
         assert toc.hash_entries[0].sha1 == sha1
         assert toc.entry_count == 1
 
-    def test_multiple_entries(self, tmp_path):
+    def test_multiple_entries(self):
         entries = [(i * 1000, bytes([i]) * 20) for i in range(5)]
         data = build_rdar_binary(entries)
-        archive = tmp_path / "multi.archive"
-        archive.write_bytes(data)
+        archive = io.BytesIO(data)
 
         toc = parse_rdar_toc(archive)
         assert len(toc.hash_entries) == 5
@@ -85,86 +86,98 @@ class TestParseRdarToc:
             assert entry.hash == i * 1000
             assert entry.sha1 == bytes([i]) * 20
 
-    def test_zero_entries(self, tmp_path):
+    def test_zero_entries(self):
         data = build_rdar_binary([])
-        archive = tmp_path / "empty.archive"
-        archive.write_bytes(data)
+        archive = io.BytesIO(data)
 
         toc = parse_rdar_toc(archive)
         assert len(toc.hash_entries) == 0
         assert toc.entry_count == 0
 
-    def test_header_fields_preserved(self, tmp_path):
+    def test_header_fields_preserved(self):
         data = build_rdar_binary([(1, b"\x00" * 20)])
-        archive = tmp_path / "meta.archive"
-        archive.write_bytes(data)
+        archive = io.BytesIO(data)
 
         toc = parse_rdar_toc(archive)
         assert toc.header.magic == RDAR_MAGIC
         assert toc.header.version == 12
         assert toc.header.archive_id == 1
 
-    def test_table_offset_exceeds_file_size_raises(self, tmp_path):
-        header = struct.pack("<4sIQIIQQ", RDAR_MAGIC, 12, 99999, 0, 0, 0, 100)
-        archive = tmp_path / "bad_offset.archive"
-        archive.write_bytes(header)
+    def test_table_offset_exceeds_file_size_raises(self):
+        header = _HDR.pack(RDAR_MAGIC, 12, 99999, 0, 0, 0, 100)
+        archive = io.BytesIO(header)
 
         with pytest.raises(ValueError, match=r"table_offset.*exceeds.*file_size"):
             parse_rdar_toc(archive)
 
-    def test_unreasonable_num_files_raises(self, tmp_path):
+    def test_unreasonable_num_files_raises(self):
         table_offset = HEADER_SIZE
         file_size = HEADER_SIZE + TOC_PREAMBLE_SIZE + 100
-        header = struct.pack("<4sIQIIQQ", RDAR_MAGIC, 12, table_offset, 0, 0, 0, file_size)
-        toc_meta = struct.pack("<IIQIII", 0, 0, 0, 2**31, 0, 0)
-        archive = tmp_path / "huge.archive"
-        archive.write_bytes(header + toc_meta)
+        header = _HDR.pack(RDAR_MAGIC, 12, table_offset, 0, 0, 0, file_size)
+        toc_meta = _TOC.pack(0, 0, 0, 2**31, 0, 0)
+        archive = io.BytesIO(header + toc_meta)
 
         with pytest.raises(ValueError, match="Unreasonable hash table size"):
             parse_rdar_toc(archive)
 
-    def test_corrupt_toc_raises(self, tmp_path):
-        header = struct.pack("<4sIQIIQQ", RDAR_MAGIC, 12, HEADER_SIZE, 0, 0, 0, 100)
-        archive = tmp_path / "corrupt.archive"
-        archive.write_bytes(header + b"\x00" * 5)
+    def test_corrupt_toc_raises(self):
+        header = _HDR.pack(RDAR_MAGIC, 12, HEADER_SIZE, 0, 0, 0, 100)
+        archive = io.BytesIO(header + b"\x00" * 5)
 
         with pytest.raises(ValueError, match="TOC preamble truncated"):
             parse_rdar_toc(archive)
 
-    def test_truncated_hash_entries_raises(self, tmp_path):
+    def test_truncated_hash_entries_raises(self):
         table_offset = HEADER_SIZE
-        header = struct.pack("<4sIQIIQQ", RDAR_MAGIC, 12, table_offset, 0, 0, 0, 200)
-        toc_meta = struct.pack("<IIQIII", 0, 0, 0, 3, 0, 0)
-        archive = tmp_path / "truncated.archive"
-        archive.write_bytes(header + toc_meta + b"\x00" * 10)
+        header = _HDR.pack(RDAR_MAGIC, 12, table_offset, 0, 0, 0, 200)
+        toc_meta = _TOC.pack(0, 0, 0, 3, 0, 0)
+        archive = io.BytesIO(header + toc_meta + b"\x00" * 10)
 
         with pytest.raises(ValueError, match="Hash entries truncated"):
             parse_rdar_toc(archive)
 
+    def test_accepts_path(self, tmp_path):
+        archive = tmp_path / "on_disk.archive"
+        archive.write_bytes(build_rdar_binary([(0xF00D, b"\x03" * 20)]))
+
+        toc = parse_rdar_toc(archive)
+        assert toc.hash_entries[0].hash == 0xF00D
+        assert parse_rdar_toc(str(archive)) == toc
+
     def test_nonexistent_file_raises(self):
         with pytest.raises(FileNotFoundError):
             parse_rdar_toc("/nonexistent/path/test.archive")
 
-    def test_num_chunks_parsed(self, tmp_path):
+    def test_num_chunks_parsed(self):
         sha1 = b"\x00" * 20
         table_offset = HEADER_SIZE
         file_size = HEADER_SIZE + TOC_PREAMBLE_SIZE + HASH_ENTRY_SIZE
-        header = struct.pack("<4sIQIIQQ", RDAR_MAGIC, 12, table_offset, 0, 0, 0, file_size)
-        toc_meta = struct.pack("<IIQIII", 0, 0, 0, 1, 0, 0)
-        entry = struct.pack("<QQIIIII", 42, 999, 7, 0, 0, 0, 0) + sha1
-        archive = tmp_path / "chunks.archive"
-        archive.write_bytes(header + toc_meta + entry)
+        header = _HDR.pack(RDAR_MAGIC, 12, table_offset, 0, 0, 0, file_size)
+        toc_meta = _TOC.pack(0, 0, 0, 1, 0, 0)
+        entry = _ENT.pack(42, 999, 7, 0, 0, 0, 0) + sha1
+        archive = io.BytesIO(header + toc_meta + entry)
 
         toc = parse_rdar_toc(archive)
         assert toc.hash_entries[0].num_chunks == 7
         assert toc.hash_entries[0].timestamp == 999
 
-    def test_deterministic_across_calls(self, tmp_path):
+    def test_deterministic_across_calls(self):
         entries = [(0xCAFE, b"\x01" * 20), (0xBEEF, b"\x02" * 20)]
         data = build_rdar_binary(entries)
-        archive = tmp_path / "deterministic.archive"
-        archive.write_bytes(data)
+        archive = io.BytesIO(data)
 
         toc1 = parse_rdar_toc(archive)
         toc2 = parse_rdar_toc(archive)
         assert toc1.hash_entries == toc2.hash_entries
+
+
+@pytest.fixture(scope="module")
+def large_archive() -> bytes:
+    return build_rdar_binary([(i, i.to_bytes(20, "little")) for i in range(100_000)])
+
+
+class TestParseRdarTocBenchmark:
+    def test_parse_100k_entries(self, benchmark, large_archive):
+        toc = benchmark(parse_rdar_toc, io.BytesIO(large_archive))
+        assert toc.entry_count == 100_000
+        assert toc.hash_entries[-1].hash == 99_999
@@ -1,8 +1,16 @@
 import contextlib
+import functools
+import os
+import shutil
+import tempfile
 from collections.abc import Generator
+from datetime import datetime
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
+from fixtures.zip_blobs import write_zip
+from sqlalchemy import insert
 from sqlmodel import Session, SQLModel, create_engine
 from sqlmodel.pool import StaticPool
 
@@ -10,19 +18,71 @@ import rippermod_manager.models  # noqa: F401 — register all tables
 from rippermod_manager.database import get_session
 from rippermod_manager.main import app
 from rippermod_manager.models.game import Game, GameModPath
+from rippermod_manager.models.install import InstalledMod, InstalledModFile
 
+# Opt-in: RMM_TEST_TMPFS=1 puts tmp_path on tmpfs so archive fixtures skip disk I/O
+_TMPFS_DIR = "/dev/shm"
+_TMPFS_MIN_FREE = 512 * 1024 * 1024
 
-@pytest.fixture
-def engine():
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Use a private tmpfs basetemp for this run when ``RMM_TEST_TMPFS`` is set.
+
+    Each run gets its own directory, so concurrent runs never wipe each
+    other's ``tmp_path``; it is skipped when tmpfs is nearly full.
+    """
+    if config.option.basetemp or not os.environ.get("RMM_TEST_TMPFS"):
+        return
+    if not (os.path.isdir(_TMPFS_DIR) and os.access(_TMPFS_DIR, os.W_OK)):
+        return
+    if shutil.disk_usage(_TMPFS_DIR).free < _TMPFS_MIN_FREE:
+        return
+    basetemp = tempfile.mkdtemp(prefix="pytest-", dir=_TMPFS_DIR)
+    config.option.basetemp = basetemp
+    config.add_cleanup(functools.partial(shutil.rmtree, basetemp, ignore_errors=True))
+
+
+def _memory_engine():
+    """Single-connection in-memory engine tuned for throwaway test databases.
+
+    An in-memory database already journals in RAM; synchronous=OFF and
+    temp_store=MEMORY also keep sorter/temp b-trees off disk.
+    """
     eng = create_engine(
         "sqlite://",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+    with eng.connect() as conn:
+        dbapi_conn = conn.connection.driver_connection
+        dbapi_conn.execute("PRAGMA synchronous=OFF")
+        dbapi_conn.execute("PRAGMA temp_store=MEMORY")
+    return eng
+
+
+def _create_test_engine():
+    eng = _memory_engine()
     SQLModel.metadata.create_all(eng)
     return eng
 
 
+@pytest.fixture(scope="session")
+def _schema_template():
+    """In-memory database with the full schema, created once per session."""
+    eng = _create_test_engine()
+    yield eng.raw_connection().driver_connection
+    eng.dispose()
+
+
+@pytest.fixture
+def engine(_schema_template):
+    eng = _memory_engine()
+    with eng.connect() as conn:
+        _schema_template.backup(conn.connection.driver_connection)
+    return eng
+
+
 def _safe_monkeypatch_engine(monkeypatch, engine):
     """Monkeypatch engine references, skipping modules with unavailable deps."""
     monkeypatch.setattr("rippermod_manager.database.engine", engine)
@@ -41,8 +101,17 @@ def session(engine, monkeypatch):
         yield sess
 
 
+@pytest.fixture(scope="session")
+def _client_singleton():
+    """Run the app lifespan once per session against a throwaway engine."""
+    with pytest.MonkeyPatch.context() as mp:
+        _safe_monkeypatch_engine(mp, _create_test_engine())
+        with TestClient(app, raise_server_exceptions=False) as tc:
+            yield tc
+
+
 @pytest.fixture
-def client(engine, monkeypatch):
+def client(_client_singleton, engine, monkeypatch):
     _safe_monkeypatch_engine(monkeypatch, engine)
 
     def _override_session() -> Generator[Session, None, None]:
@@ -50,9 +119,8 @@ def client(engine, monkeypatch):
             yield sess
 
     app.dependency_overrides[get_session] = _override_session
-    with TestClient(app, raise_server_exceptions=False) as tc:
-        yield tc
-    app.dependency_overrides.clear()
+    yield _client_singleton
+    app.dependency_overrides.pop(get_session, None)
 
 
 @pytest.fixture
@@ -88,3 +156,32 @@ def make_game(session):
         return game
 
     return _make
+
+
+@pytest.fixture
+def make_installed_mod(session):
+    """Write a staged source archive and insert an InstalledMod with its files."""
+
+    def _make(
+        game: Game,
+        name: str,
+        source_archive: str,
+        files: dict[str, bytes],
+        installed_at: datetime | None = None,
+    ) -> InstalledMod:
+        staging = Path(game.install_path) / "downloaded_mods"
+        staging.mkdir(parents=True, exist_ok=True)
+        write_zip(staging / source_archive, files)
+
+        mod = InstalledMod(game_id=game.id, name=name, source_archive=source_archive)
+        if installed_at is not None:
+            mod.installed_at = installed_at
+        session.add(mod)
+        session.flush()
+        # One executemany for the file rows instead of an INSERT per file
+        rows = [{"installed_mod_id": mod.id, "relative_path": rel} for rel in files]
+        session.exec(insert(InstalledModFile), params=rows)
+        session.expire(mod, ["files"])
+        return mod
+
+    return _make
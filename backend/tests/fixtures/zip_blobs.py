@@ -0,0 +1,71 @@
+"""Prebuilt ZIP archive bytes for tests.
+
+Archives are emitted directly as stored (uncompressed) ZIP records with
+fixed entry timestamps, so the same file mapping always yields the same
+bytes. Each distinct mapping is built once per process.
+"""
+
+from __future__ import annotations
+
+import functools
+import struct
+import zlib
+from pathlib import Path
+
+# signature, version needed, flags, method, mtime, mdate, crc32, csize, usize, name len, extra len
+_LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+# signature, version made by, version needed, flags, method, mtime, mdate, crc32, csize,
+# usize, name len, extra len, comment len, disk start, internal attr, external attr, offset
+_CENTRAL_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+# signature, disk, cd disk, entries on disk, total entries, cd size, cd offset, comment len
+_END_OF_CENTRAL_DIR = struct.Struct("<IHHHHIIH")
+
+_VERSION = 20
+_UTF8_FLAG = 0x800
+_DOS_DATE = (0 << 9) | (1 << 5) | 1  # 1980-01-01
+_DOS_TIME = 0
+_FILE_ATTR = 0o100644 << 16
+_DIR_ATTR = (0o40775 << 16) | 0x10
+
+
+def _build(files: tuple[tuple[str, bytes], ...]) -> bytes:
+    body: list[bytes] = []
+    central: list[bytes] = []
+    offset = 0
+    for name, content in files:
+        try:
+            raw_name, flags = name.encode("ascii"), 0
+        except UnicodeEncodeError:
+            raw_name, flags = name.encode("utf-8"), _UTF8_FLAG
+        crc = zlib.crc32(content)
+        size = len(content)
+        attr = _DIR_ATTR if name.endswith("/") else _FILE_ATTR
+        local = _LOCAL_HEADER.pack(
+            0x04034B50, _VERSION, flags, 0, _DOS_TIME, _DOS_DATE, crc, size, size, len(raw_name), 0
+        )
+        entry = _CENTRAL_HEADER.pack(
+            0x02014B50, _VERSION, _VERSION, flags, 0, _DOS_TIME, _DOS_DATE, crc, size, size,
+            len(raw_name), 0, 0, 0, 0, attr, offset,
+        )  # fmt: skip
+        central.append(entry + raw_name)
+        body += (local, raw_name, content)
+        offset += len(local) + len(raw_name) + size
+
+    directory = b"".join(central)
+    end = _END_OF_CENTRAL_DIR.pack(
+        0x06054B50, 0, 0, len(central), len(central), len(directory), offset, 0
+    )
+    return b"".join(body) + directory + end
+
+
+_build_cached = functools.cache(_build)
+
+
+def zip_bytes(files: dict[str, bytes]) -> bytes:
+    """Return stored (uncompressed) ZIP bytes for a filename -> content mapping."""
+    return _build_cached(tuple(files.items()))
+
+
+def write_zip(path: Path, files: dict[str, bytes]) -> None:
+    """Write :func:`zip_bytes` for *files* to *path* as an independent copy."""
+    path.write_bytes(zip_bytes(files))
@@ -1,5 +1,9 @@
+import pytest
+
+from rippermod_manager.matching import clear_caches
 from rippermod_manager.matching.correlator import (
     _categories_compatible,
+    _TokenVocabulary,
     classify_group_category,
     compute_name_score,
     correlate_game_mods,
@@ -11,41 +15,64 @@ from rippermod_manager.models.mod import ModFile, ModGroup
 from rippermod_manager.models.nexus import NexusDownload, NexusModMeta
 
 
-class TestTokenJaccard:
-    def test_identical(self):
-        assert token_jaccard("cyber engine tweaks", "cyber engine tweaks") == 1.0
+def _add_correlated_pair(session, game, group_name, mod_name, nexus_mod_id, **correlation):
+    """Add a group and a download, linked by an existing correlation."""
+    group = ModGroup(game_id=game.id, display_name=group_name)
+    dl = NexusDownload(game_id=game.id, nexus_mod_id=nexus_mod_id, mod_name=mod_name)
+    session.add_all([group, dl])
+    session.flush()
+    session.add(ModNexusCorrelation(mod_group_id=group.id, nexus_download_id=dl.id, **correlation))
+    session.flush()
+    return group, dl
 
-    def test_no_overlap(self):
-        assert token_jaccard("alpha beta", "gamma delta") == 0.0
+
+class TestTokenJaccard:
+    @pytest.mark.parametrize(
+        "a,b,expected",
+        [
+            pytest.param("cyber engine tweaks", "cyber engine tweaks", 1.0, id="identical"),
+            pytest.param("alpha beta", "gamma delta", 0.0, id="no_overlap"),
+            pytest.param("", "hello", 0.0, id="empty_left"),
+            pytest.param("hello", "", 0.0, id="empty_right"),
+        ],
+    )
+    def test_exact_scores(self, a, b, expected):
+        assert token_jaccard(a, b) == expected
 
     def test_partial_overlap(self):
         score = token_jaccard("cyber engine tweaks", "cyber engine")
         assert 0.0 < score < 1.0
 
-    def test_empty_returns_zero(self):
-        assert token_jaccard("", "hello") == 0.0
-        assert token_jaccard("hello", "") == 0.0
+    def test_vocabulary_is_per_pass(self):
+        first = _TokenVocabulary()
+        assert first.bitset("cyber engine") == 0b11
+        assert first.bitset("engine tweaks") == 0b110
+        # A fresh vocabulary starts at bit 0 instead of growing a shared one
+        assert _TokenVocabulary().bitset("tweaks") == 0b1
 
 
 class TestNormalize:
-    def test_basic(self):
-        assert normalize("My-Mod_Name") == "my mod name"
-
-    def test_dots(self):
-        assert normalize("v1.2.3") == "v1 2 3"
-
-    def test_camel_case_splitting(self):
-        assert normalize("EgghancedBloodFx") == "egghanced blood fx"
-
-    def test_ordering_prefix_stripped(self):
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            pytest.param("My-Mod_Name", "my mod name", id="basic"),
+            pytest.param("v1.2.3", "v1 2 3", id="dots"),
+            pytest.param("EgghancedBloodFx", "egghanced blood fx", id="camel_case_splitting"),
+            pytest.param("##EgghancedBloodFx", "egghanced blood fx", id="ordering_prefix"),
+            pytest.param("zModName", "mod name", id="z_prefix_stripped"),
+            pytest.param("zebra", "zebra", id="z_lowercase_preserved"),
+        ],
+    )
+    def test_normalize(self, raw, expected):
+        assert normalize(raw) == expected
+
+    def test_clear_caches(self):
+        normalize("##EgghancedBloodFx")
+        assert normalize.cache_info().currsize > 0
+        clear_caches()
+        assert normalize.cache_info().currsize == 0
         assert normalize("##EgghancedBloodFx") == "egghanced blood fx"
 
-    def test_z_prefix_stripped(self):
-        assert normalize("zModName") == "mod name"
-
-    def test_z_lowercase_preserved(self):
-        assert normalize("zebra") == "zebra"
-
 
 class TestComputeNameScore:
     def test_exact_match(self):
@@ -53,6 +80,12 @@ class TestComputeNameScore:
         assert score == 1.0
         assert method == "exact"
 
+    def test_repeated_pair_is_cached(self):
+        clear_caches()
+        first = compute_name_score("Better Vehicle Handling", "Vehicle Handling Overhaul")
+        assert compute_name_score("Better Vehicle Handling", "Vehicle Handling Overhaul") == first
+        assert compute_name_score.cache_info().hits == 1
+
     def test_substring_match(self):
         score, method = compute_name_score("weather", "enhanced weather mod")
         assert score == 0.9
@@ -99,7 +132,7 @@ class TestCorrelateGameMods:
     def test_no_downloads(self, session, make_game):
         game = make_game()
         session.add(ModGroup(game_id=game.id, display_name="MyMod"))
-        session.commit()
+        session.flush()
         result = correlate_game_mods(game, session)
         assert result.total_groups == 1
         assert result.matched == 0
@@ -114,7 +147,7 @@ class TestCorrelateGameMods:
             mod_name="Enhanced Weather",
         )
         session.add(dl)
-        session.commit()
+        session.flush()
         result = correlate_game_mods(game, session)
         assert result.matched == 1
 
@@ -122,23 +155,13 @@ class TestCorrelateGameMods:
         game = make_game()
         session.add(ModGroup(game_id=game.id, display_name="AAAA"))
         session.add(NexusDownload(game_id=game.id, nexus_mod_id=200, mod_name="ZZZZ"))
-        session.commit()
+        session.flush()
         result = correlate_game_mods(game, session)
         assert result.matched == 0
 
     def test_skips_already_matched(self, session, make_game):
         game = make_game()
-        group = ModGroup(game_id=game.id, display_name="CET")
-        session.add(group)
-        dl = NexusDownload(game_id=game.id, nexus_mod_id=300, mod_name="CET")
-        session.add(dl)
-        session.flush()
-        session.add(
-            ModNexusCorrelation(
-                mod_group_id=group.id, nexus_download_id=dl.id, score=1.0, method="exact"
-            )
-        )
-        session.commit()
+        _add_correlated_pair(session, game, "CET", "CET", 300, score=1.0, method="exact")
         result = correlate_game_mods(game, session)
         assert result.matched == 1
         assert result.unmatched == 0
@@ -148,25 +171,11 @@ class TestCorrelateGameMods:
         from sqlmodel import select
 
         game = make_game()
-        group = ModGroup(game_id=game.id, display_name="Yaiba Muramasa")
-        session.add(group)
-        dl = NexusDownload(
-            game_id=game.id,
-            nexus_mod_id=500,
-            mod_name="Lizzie's Braindances",  # name updated by sync
+        # Stale correlation: was "exact" when dl.mod_name matched, but sync
+        # has since renamed the download
+        _add_correlated_pair(
+            session, game, "Yaiba Muramasa", "Lizzie's Braindances", 500, score=1.0, method="exact"
         )
-        session.add(dl)
-        session.flush()
-        # Stale correlation: was "exact" when dl.mod_name matched, now doesn't
-        session.add(
-            ModNexusCorrelation(
-                mod_group_id=group.id,
-                nexus_download_id=dl.id,
-                score=1.0,
-                method="exact",
-            )
-        )
-        session.commit()
 
         result = correlate_game_mods(game, session)
         # Stale correlation purged, group now unmatched
@@ -178,25 +187,16 @@ class TestCorrelateGameMods:
     def test_preserves_confirmed_correlation(self, session, make_game):
         """User-confirmed correlations are never purged."""
         game = make_game()
-        group = ModGroup(game_id=game.id, display_name="CustomMod")
-        session.add(group)
-        dl = NexusDownload(
-            game_id=game.id,
-            nexus_mod_id=600,
-            mod_name="Totally Different Name",
+        _add_correlated_pair(
+            session,
+            game,
+            "CustomMod",
+            "Totally Different Name",
+            600,
+            score=1.0,
+            method="exact",
+            confirmed_by_user=True,
         )
-        session.add(dl)
-        session.flush()
-        session.add(
-            ModNexusCorrelation(
-                mod_group_id=group.id,
-                nexus_download_id=dl.id,
-                score=1.0,
-                method="exact",
-                confirmed_by_user=True,
-            )
-        )
-        session.commit()
 
         result = correlate_game_mods(game, session)
         assert result.matched == 1  # preserved
@@ -204,24 +204,9 @@ class TestCorrelateGameMods:
     def test_preserves_non_name_methods(self, session, make_game):
         """Correlations via filename_id, md5, file_list are never purged."""
         game = make_game()
-        group = ModGroup(game_id=game.id, display_name="SomeMod")
-        session.add(group)
-        dl = NexusDownload(
-            game_id=game.id,
-            nexus_mod_id=700,
-            mod_name="Completely Unrelated",
+        _add_correlated_pair(
+            session, game, "SomeMod", "Completely Unrelated", 700, score=0.95, method="filename_id"
         )
-        session.add(dl)
-        session.flush()
-        session.add(
-            ModNexusCorrelation(
-                mod_group_id=group.id,
-                nexus_download_id=dl.id,
-                score=0.95,
-                method="filename_id",
-            )
-        )
-        session.commit()
 
         result = correlate_game_mods(game, session)
         assert result.matched == 1  # preserved
@@ -245,7 +230,7 @@ class TestCorrelateGameMods:
         session.add(
             NexusModMeta(nexus_mod_id=801, endorsement_count=5000, game_domain="cyberpunk2077")
         )
-        session.commit()
+        session.flush()
 
         result = correlate_game_mods(game, session)
         assert result.matched == 1
@@ -289,11 +274,78 @@ class TestCorrelateGameMods:
                 game_domain="cyberpunk2077",
             )
         )
-        session.commit()
+        session.flush()
 
         result = correlate_game_mods(game, session)
         assert result.matched == 1
 
+    def test_claimed_filename_id_falls_back_to_name_match(self, session, make_game):
+        from sqlmodel import select
+
+        game = make_game()
+        first = ModGroup(game_id=game.id, display_name="Alpha Mod")
+        second = ModGroup(game_id=game.id, display_name="Beta Overhaul")
+        session.add_all([first, second])
+        session.flush()
+        # Both archives carry Nexus ID 1000; only the first group can claim it
+        for group, filename in (
+            (first, "AlphaMod-1000-1-0-1700000000.zip"),
+            (second, "BetaOverhaul-1000-1-0-1700000000.zip"),
+        ):
+            session.add(
+                ModFile(
+                    mod_group_id=group.id,
+                    filename=filename,
+                    file_path=filename,
+                    file_hash="h",
+                    file_size=1,
+                )
+            )
+        session.add_all(
+            [
+                NexusDownload(game_id=game.id, nexus_mod_id=1000, mod_name="Alpha Mod"),
+                NexusDownload(game_id=game.id, nexus_mod_id=1001, mod_name="Beta Overhaul"),
+            ]
+        )
+        session.flush()
+
+        result = correlate_game_mods(game, session)
+        assert result.matched == 2
+        rows = session.exec(
+            select(ModNexusCorrelation.mod_group_id, ModNexusCorrelation.method, NexusDownload)
+            .join(NexusDownload, ModNexusCorrelation.nexus_download_id == NexusDownload.id)
+            .order_by(ModNexusCorrelation.mod_group_id)
+        ).all()
+        assert [(gid, method, dl.nexus_mod_id) for gid, method, dl in rows] == [
+            (first.id, "filename_id", 1000),
+            (second.id, "exact", 1001),
+        ]
+
+    def test_dedup_keeps_best_correlation_per_nexus_mod(self, session, make_game):
+        from sqlmodel import select
+
+        game = make_game()
+        strong = ModGroup(game_id=game.id, display_name="Alpha")
+        weak = ModGroup(game_id=game.id, display_name="Beta")
+        session.add_all([strong, weak])
+        dl = NexusDownload(game_id=game.id, nexus_mod_id=950, mod_name="Gamma")
+        session.add(dl)
+        session.flush()
+        for group, score in ((strong, 0.95), (weak, 0.6)):
+            session.add(
+                ModNexusCorrelation(
+                    mod_group_id=group.id,
+                    nexus_download_id=dl.id,
+                    score=score,
+                    method="filename_id",
+                )
+            )
+        session.flush()
+
+        correlate_game_mods(game, session)
+        corrs = session.exec(select(ModNexusCorrelation)).all()
+        assert [(c.mod_group_id, c.score) for c in corrs] == [(strong.id, 0.95)]
+
 
 class TestCategoryClassification:
     def test_scripts_classification(self):
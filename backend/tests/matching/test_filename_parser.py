@@ -177,6 +177,10 @@ class TestIsNewerVersion:
             ("0.9.9", "1.0.0", False),
             ("0.15.0", "0.2.0", True),
             ("1.0", "1.0-alpha", True),
+            ("1.0.0", "1.0", False),
+            ("1.0", "1.0.0", False),
+            ("1.0.1", "1.0", True),
+            ("1.0", "1.0.0-beta", True),
         ],
     )
     def test_parametrized_comparisons(self, latest, installed, expected):
@@ -1,8 +1,15 @@
+import asyncio
+
 import httpx
 import pytest
 import respx
 
-from rippermod_manager.nexus.client import BASE_URL, NexusClient
+from rippermod_manager.nexus.client import (
+    BASE_URL,
+    NexusClient,
+    _shared_clients,
+    close_shared_client,
+)
 
 
 class TestNexusClient:
@@ -73,3 +80,54 @@ class TestNexusClient:
             result = await client.get_mod_info("cyberpunk2077", 42)
         assert result["name"] == "Test Mod"
         assert route.called
+
+    @pytest.mark.asyncio
+    async def test_instances_share_connection_pool(self):
+        async with NexusClient("a") as first:
+            pooled = first.client
+        async with NexusClient("b") as second:
+            assert second.client is pooled
+        assert not pooled.is_closed
+
+        await close_shared_client()
+        assert pooled.is_closed
+        async with NexusClient("c") as third:
+            assert third.client is not pooled
+        await close_shared_client()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_shared_pool_does_not_keep_cookies(self):
+        route = respx.get(f"{BASE_URL}/v1/users/validate.json").mock(
+            return_value=httpx.Response(
+                200, json={"name": "u"}, headers={"Set-Cookie": "session=abc; Path=/"}
+            )
+        )
+        async with NexusClient("a") as first:
+            await first.validate_key()
+        async with NexusClient("b") as second:
+            await second.validate_key()
+        await close_shared_client()
+        assert "cookie" not in route.calls[1].request.headers
+
+    def test_private_loop_releases_pooled_client(self):
+        async def _use_client():
+            async with NexusClient("key") as client:
+                pooled = client.client
+            await close_shared_client()
+            return pooled
+
+        loop = asyncio.new_event_loop()
+        try:
+            pooled = loop.run_until_complete(_use_client())
+            assert loop not in _shared_clients
+        finally:
+            loop.close()
+        assert pooled.is_closed
+
+    @pytest.mark.asyncio
+    async def test_exited_client_raises(self):
+        async with NexusClient("key") as client:
+            pass
+        with pytest.raises(RuntimeError, match="not entered"):
+            _ = client.client
@@ -1,4 +1,4 @@
-from unittest.mock import patch
+import pytest
 
 
 class TestChatHistory:
@@ -22,20 +22,25 @@ class TestChatHistory:
         assert len(data) == 2
 
 
+@pytest.fixture
+def mock_run_agent(monkeypatch):
+    """Replace the orchestrator's agent with one that streams a single token."""
+
+    async def agent(msg, game_name=None, **kwargs):
+        yield {"type": "token", "data": {"content": "response"}}
+
+    monkeypatch.setattr("rippermod_manager.agents.orchestrator.run_agent", agent)
+    return agent
+
+
 class TestChat:
-    def test_stores_user_message(self, client, engine):
-        async def mock_agent(msg, game_name=None):
-            yield {"type": "token", "data": {"content": "response"}}
-
-        with patch(
-            "rippermod_manager.agents.orchestrator.run_agent",
-            side_effect=mock_agent,
-        ):
-            r = client.post(
-                "/api/v1/chat/",
-                json={"message": "test message"},
-            )
+    def test_stores_user_message(self, client, engine, mock_run_agent):
+        r = client.post(
+            "/api/v1/chat/",
+            json={"message": "test message"},
+        )
         assert r.status_code == 200
+        assert "event: done" in r.text
 
         from sqlmodel import Session, select
 
@@ -45,27 +50,23 @@ class TestChat:
             msgs = s.exec(select(ChatMessage).where(ChatMessage.role == "user")).all()
             assert any(m.content == "test message" for m in msgs)
 
-    def test_sse_content_type(self, client):
-        async def mock_agent(msg, game_name=None):
-            yield {"type": "token", "data": {"content": "hi"}}
-
-        with patch(
-            "rippermod_manager.agents.orchestrator.run_agent",
-            side_effect=mock_agent,
-        ):
-            r = client.post(
-                "/api/v1/chat/",
-                json={"message": "hello"},
-            )
+    def test_sse_content_type(self, client, mock_run_agent):
+        r = client.post(
+            "/api/v1/chat/",
+            json={"message": "hello"},
+        )
         assert "text/event-stream" in r.headers["content-type"]
+        assert "event: done" in r.text
+
+    def test_fallback_when_no_agent(self, client, monkeypatch):
+        def raise_import_error(*args, **kwargs):
+            raise ImportError("no agent")
 
-    def test_fallback_when_no_agent(self, client):
-        with patch(
-            "rippermod_manager.agents.orchestrator.run_agent",
-            side_effect=ImportError("no agent"),
-        ):
-            r = client.post(
-                "/api/v1/chat/",
-                json={"message": "hello"},
-            )
+        monkeypatch.setattr("rippermod_manager.agents.orchestrator.run_agent", raise_import_error)
+        r = client.post(
+            "/api/v1/chat/",
+            json={"message": "hello"},
+        )
         assert r.status_code == 200
+        assert "Chat agent not yet configured" in r.text
+        assert "event: done" in r.text
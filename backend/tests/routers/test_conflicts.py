@@ -1,15 +1,18 @@
 """Contract tests for the conflicts router endpoints."""
 
-import zipfile
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import pytest
-from sqlmodel import Session, select
+from fixtures.zip_blobs import write_zip
+from sqlalchemy import insert
+from sqlmodel import Session
 
 from rippermod_manager.models.archive_index import ArchiveEntryIndex
 from rippermod_manager.models.game import Game, GameModPath
 from rippermod_manager.models.install import InstalledMod, InstalledModFile
+from rippermod_manager.services.archive_index_service import index_game_archives
+from rippermod_manager.services.conflicts.engine import ConflictEngine
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -17,42 +20,58 @@ from rippermod_manager.models.install import InstalledMod, InstalledModFile
 
 
 def _make_zip(path: Path, files: dict[str, bytes]) -> None:
-    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED) as zf:
-        for name, content in files.items():
-            zf.writestr(name, content)
+    write_zip(path, files)
 
 
-def _add_conflicting_mods(engine, game_name: str, paths: list[str]) -> None:
+def _add_conflicting_mods(engine, game_id: int, paths: list[str]) -> None:
     """Add two mods that share the same files."""
     with Session(engine) as s:
-        game = s.exec(select(Game).where(Game.name == game_name)).first()
-        mod_a = InstalledMod(game_id=game.id, name="ModA")
-        mod_b = InstalledMod(game_id=game.id, name="ModB")
-        s.add_all([mod_a, mod_b])
-        s.flush()
-        for p in paths:
-            s.add(InstalledModFile(installed_mod_id=mod_a.id, relative_path=p))
-            s.add(InstalledModFile(installed_mod_id=mod_b.id, relative_path=p))
+        mods = [
+            InstalledMod(game_id=game_id, name=name).model_dump(exclude={"id"})
+            for name in ("ModA", "ModB")
+        ]
+        # One multi-row INSERT ... RETURNING for both mods, one executemany for their files
+        mod_ids = s.exec(insert(InstalledMod).values(mods).returning(InstalledMod.id)).scalars()
+        files = [{"installed_mod_id": i, "relative_path": p} for i in mod_ids for p in paths]
+        s.exec(insert(InstalledModFile), params=files)
         s.commit()
 
 
-def _install_mod(engine, game_id, name, archive, staging, files, installed_at=None):
+def _reindex(engine, game_id: int) -> None:
+    """Run what POST /conflicts/reindex does, without the HTTP round-trip."""
+    with Session(engine) as s:
+        game = s.get(Game, game_id)
+        index_game_archives(game, s)
+        ConflictEngine().run(game, s)
+
+
+# Fixed install time for tests that do not care about ordering
+_INSTALLED_AT = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _build_installed_mod(game_id, name, archive, staging, files, installed_at=_INSTALLED_AT):
+    """Helper: write a zip archive and return an unsaved InstalledMod for it."""
+    _make_zip(staging / archive, files)
+    return InstalledMod(
+        game_id=game_id,
+        name=name,
+        source_archive=archive,
+        installed_at=installed_at,
+    )
+
+
+def _install_mod(engine, game_id, name, archive, staging, files, installed_at=_INSTALLED_AT):
     """Helper: create InstalledMod + InstalledModFile rows and a zip archive."""
-    archive_path = staging / archive
-    _make_zip(archive_path, files)
+    mod = _build_installed_mod(game_id, name, archive, staging, files, installed_at)
+    paths = [p.lower() for p in files]
     with Session(engine) as s:
-        mod = InstalledMod(
-            game_id=game_id,
-            name=name,
-            source_archive=archive,
-            installed_at=installed_at or datetime.now(UTC),
-        )
         s.add(mod)
         s.flush()
-        for rel_path in files:
-            s.add(InstalledModFile(installed_mod_id=mod.id, relative_path=rel_path.lower()))
+        mod_id = mod.id
+        rows = [{"installed_mod_id": mod_id, "relative_path": p} for p in paths]
+        s.exec(insert(InstalledModFile), params=rows)
         s.commit()
-        return mod.id
+        return mod_id
 
 
 # ---------------------------------------------------------------------------
@@ -68,12 +87,12 @@ def game_setup(tmp_path, client, engine):
 
     with Session(engine) as s:
         g = Game(name="ConflictsGame", domain_name="cg", install_path=str(game_dir))
+        g.mod_paths = [GameModPath(relative_path="mods")]
         s.add(g)
-        s.flush()
-        s.add(GameModPath(game_id=g.id, relative_path="mods"))
         s.commit()
+        game_id = g.id
 
-    return "ConflictsGame", game_dir
+    return "ConflictsGame", game_dir, game_id
 
 
 @pytest.fixture
@@ -86,15 +105,29 @@ def archive_game_setup(tmp_path, client, engine):
 
     with Session(engine) as s:
         g = Game(name="ConflictsGame", domain_name="cg", install_path=str(game_dir))
+        g.mod_paths = [GameModPath(relative_path="mods")]
         s.add(g)
-        s.flush()
-        s.add(GameModPath(game_id=g.id, relative_path="mods"))
         s.commit()
         game_id = g.id
 
     return "ConflictsGame", game_dir, staging, game_id
 
 
+@pytest.fixture
+def conflict_seeded(archive_game_setup, engine):
+    """Game with two staged mods overlapping on a low- and a medium-severity path, reindexed.
+
+    ModB is installed last. Returns the game name.
+    """
+    game_name, _, staging, game_id = archive_game_setup
+    t1 = datetime(2024, 1, 1, tzinfo=UTC)
+    for name, installed_at in (("ModA", t1), ("ModB", t1 + timedelta(hours=1))):
+        files = {"overlap.dll": b"x", "mods/readme.txt": b"x", f"mods/{name}.txt": b"x"}
+        _install_mod(engine, game_id, name, f"{name}.zip", staging, files, installed_at)
+    _reindex(engine, game_id)
+    return game_name
+
+
 # ---------------------------------------------------------------------------
 # Persisted engine endpoint tests
 # ---------------------------------------------------------------------------
@@ -102,7 +135,7 @@ def archive_game_setup(tmp_path, client, engine):
 
 class TestConflictSummary:
     def test_empty_summary(self, client, game_setup):
-        game_name, _ = game_setup
+        game_name, *_ = game_setup
         r = client.get(f"/api/v1/games/{game_name}/conflicts/summary")
         assert r.status_code == 200
         data = r.json()
@@ -114,12 +147,8 @@ class TestConflictSummary:
         r = client.get("/api/v1/games/NoSuchGame/conflicts/summary")
         assert r.status_code == 404
 
-    def test_summary_has_expected_shape(self, client, game_setup, engine):
-        game_name, _ = game_setup
-        _add_conflicting_mods(engine, game_name, ["overlap.dll"])
-        client.post(f"/api/v1/games/{game_name}/conflicts/reindex")
-
-        r = client.get(f"/api/v1/games/{game_name}/conflicts/summary")
+    def test_summary_has_expected_shape(self, client, conflict_seeded):
+        r = client.get(f"/api/v1/games/{conflict_seeded}/conflicts/summary")
         assert r.status_code == 200
         data = r.json()
         assert "total_conflicts" in data
@@ -137,34 +166,29 @@ class TestConflictSummary:
             assert "id" in ev["mods"][0]
             assert "name" in ev["mods"][0]
 
-    def test_filter_by_kind(self, client, game_setup, engine):
-        game_name, _ = game_setup
-        _add_conflicting_mods(engine, game_name, ["shared.txt"])
-        client.post(f"/api/v1/games/{game_name}/conflicts/reindex")
-
-        r = client.get(f"/api/v1/games/{game_name}/conflicts/summary?kind=archive_entry")
+    @pytest.mark.parametrize(
+        "query,expected_keys",
+        [
+            pytest.param("", ["mods/readme.txt", "overlap.dll"], id="unfiltered"),
+            pytest.param("kind=archive_entry", ["mods/readme.txt", "overlap.dll"], id="kind_match"),
+            pytest.param("kind=redscript_target", [], id="kind_miss"),
+            pytest.param("severity=low", ["overlap.dll"], id="severity_low"),
+            pytest.param("severity=medium", ["mods/readme.txt"], id="severity_medium"),
+            pytest.param("severity=high", [], id="severity_high"),
+        ],
+    )
+    def test_filters(self, client, conflict_seeded, query, expected_keys):
+        r = client.get(f"/api/v1/games/{conflict_seeded}/conflicts/summary?{query}")
         assert r.status_code == 200
         data = r.json()
-        assert data["total_conflicts"] >= 1
-
-        r2 = client.get(f"/api/v1/games/{game_name}/conflicts/summary?kind=redscript_target")
-        assert r2.status_code == 200
-        assert r2.json()["total_conflicts"] == 0
-
-    def test_filter_by_severity(self, client, game_setup, engine):
-        game_name, _ = game_setup
-        _add_conflicting_mods(engine, game_name, ["readme.txt"])
-        client.post(f"/api/v1/games/{game_name}/conflicts/reindex")
-
-        r = client.get(f"/api/v1/games/{game_name}/conflicts/summary?severity=low")
-        assert r.status_code == 200
-        assert r.json()["total_conflicts"] >= 1
+        assert data["total_conflicts"] == len(expected_keys)
+        assert sorted(ev["key"] for ev in data["evidence"]) == expected_keys
 
 
 class TestReindexConflicts:
     def test_reindex_returns_result(self, client, game_setup, engine):
-        game_name, _ = game_setup
-        _add_conflicting_mods(engine, game_name, ["same.txt"])
+        game_name, _, game_id = game_setup
+        _add_conflicting_mods(engine, game_id, ["same.txt"])
 
         r = client.post(f"/api/v1/games/{game_name}/conflicts/reindex")
         assert r.status_code == 200
@@ -178,8 +202,8 @@ class TestReindexConflicts:
         assert r.status_code == 404
 
     def test_summary_reflects_reindex(self, client, game_setup, engine):
-        game_name, _ = game_setup
-        _add_conflicting_mods(engine, game_name, ["overlap.dll"])
+        game_name, _, game_id = game_setup
+        _add_conflicting_mods(engine, game_id, ["overlap.dll"])
 
         # Before reindex, summary is empty
         r = client.get(f"/api/v1/games/{game_name}/conflicts/summary")
@@ -197,7 +221,7 @@ class TestArchiveConflictSummaries:
         assert r.status_code == 404
 
     def test_empty_when_no_conflicts(self, client, game_setup):
-        game_name, _ = game_setup
+        game_name, *_ = game_setup
         r = client.get(f"/api/v1/games/{game_name}/conflicts/archive-summaries")
         assert r.status_code == 200
         data = r.json()
@@ -206,18 +230,17 @@ class TestArchiveConflictSummaries:
         assert data["total_archives_with_conflicts"] == 0
 
     def test_returns_summaries_with_mod_names(self, client, game_setup, engine):
-        game_name, _ = game_setup
+        game_name, _, game_id = game_setup
 
         with Session(engine) as s:
-            game = s.exec(select(Game).where(Game.name == game_name)).one()
-            mod_a = InstalledMod(game_id=game.id, name="ModAlpha")
-            mod_b = InstalledMod(game_id=game.id, name="ModBeta")
+            mod_a = InstalledMod(game_id=game_id, name="ModAlpha")
+            mod_b = InstalledMod(game_id=game_id, name="ModBeta")
             s.add_all([mod_a, mod_b])
             s.flush()
 
             s.add(
                 ArchiveEntryIndex(
-                    game_id=game.id,
+                    game_id=game_id,
                     installed_mod_id=mod_a.id,
                     archive_filename="alpha.archive",
                     archive_relative_path="archive/pc/mod/alpha.archive",
@@ -227,7 +250,7 @@ class TestArchiveConflictSummaries:
             )
             s.add(
                 ArchiveEntryIndex(
-                    game_id=game.id,
+                    game_id=game_id,
                     installed_mod_id=mod_b.id,
                     archive_filename="beta.archive",
                     archive_relative_path="archive/pc/mod/beta.archive",
@@ -278,50 +301,50 @@ class TestListConflicts:
         assert r.status_code == 200
         assert r.json()["conflict_pairs"] == []
 
-    def test_overlapping_mods_detected(self, client, archive_game_setup, engine):
+    @pytest.mark.parametrize(
+        "b_installed_last,expected_winner",
+        [
+            pytest.param(True, "ModB", id="b_installed_last"),
+            pytest.param(False, "ModA", id="a_installed_last"),
+        ],
+    )
+    def test_later_install_wins_overlap(
+        self, client, archive_game_setup, engine, b_installed_last, expected_winner
+    ):
         game_name, _, staging, game_id = archive_game_setup
         t1 = datetime(2024, 1, 1, tzinfo=UTC)
         t2 = t1 + timedelta(hours=1)
-        _install_mod(
-            engine,
-            game_id,
-            "ModA",
-            "ModA.zip",
-            staging,
-            {"mods/shared.txt": b"a", "mods/a.txt": b"a"},
-            installed_at=t1,
-        )
-        _install_mod(
-            engine,
-            game_id,
-            "ModB",
-            "ModB.zip",
-            staging,
-            {"mods/shared.txt": b"b", "mods/b.txt": b"b"},
-            installed_at=t2,
-        )
+        time_a, time_b = (t1, t2) if b_installed_last else (t2, t1)
+        files_a = {"mods/shared.txt": b"a", "mods/a.txt": b"a"}
+        files_b = {"mods/shared.txt": b"b", "mods/b.txt": b"b"}
+        _install_mod(engine, game_id, "ModA", "ModA.zip", staging, files_a, installed_at=time_a)
+        _install_mod(engine, game_id, "ModB", "ModB.zip", staging, files_b, installed_at=time_b)
 
         r = client.get("/api/v1/conflicts/", params={"game_name": game_name})
         assert r.status_code == 200
-        data = r.json()
-        assert len(data["conflict_pairs"]) == 1
-        pair = data["conflict_pairs"][0]
-        assert "mods/shared.txt" in pair["conflicting_files"]
-        assert pair["severity"] == "low"
-        assert pair["winner"] == "ModB"
-
-    def test_severity_filter(self, client, archive_game_setup, engine):
-        game_name, _, staging, game_id = archive_game_setup
-        _install_mod(engine, game_id, "ModA", "ModA.zip", staging, {"mods/x.txt": b"a"})
-        _install_mod(engine, game_id, "ModB", "ModB.zip", staging, {"mods/x.txt": b"b"})
-
-        r = client.get("/api/v1/conflicts/", params={"game_name": game_name, "severity": "high"})
-        assert r.status_code == 200
-        assert r.json()["conflict_pairs"] == []
-
-        r = client.get("/api/v1/conflicts/", params={"game_name": game_name, "severity": "low"})
+        pairs = r.json()["conflict_pairs"]
+        assert [(p["conflicting_files"], p["severity"], p["winner"]) for p in pairs] == [
+            (["mods/shared.txt"], "low", expected_winner)
+        ]
+
+    @pytest.mark.parametrize(
+        "severity,expected_pairs",
+        [
+            pytest.param("low", 1, id="low"),
+            pytest.param("medium", 0, id="medium"),
+            pytest.param("high", 0, id="high"),
+        ],
+    )
+    def test_severity_filter(self, client, conflict_seeded, severity, expected_pairs):
+        r = client.get(
+            "/api/v1/conflicts/", params={"game_name": conflict_seeded, "severity": severity}
+        )
         assert r.status_code == 200
-        assert len(r.json()["conflict_pairs"]) == 1
+        pairs = r.json()["conflict_pairs"]
+        # Two shared files make a low-severity pair, whatever their paths
+        assert [(p["conflicting_files"], p["winner"]) for p in pairs] == [
+            (["mods/readme.txt", "overlap.dll"], "ModB")
+        ] * expected_pairs
 
     def test_game_not_found(self, client):
         r = client.get("/api/v1/conflicts/", params={"game_name": "NoSuchGame"})
@@ -344,33 +367,6 @@ class TestListConflicts:
         assert len(data["skipped_mods"]) == 1
         assert data["skipped_mods"][0]["mod_name"] == "GhostMod"
 
-    def test_winner_is_later_install(self, client, archive_game_setup, engine):
-        game_name, _, staging, game_id = archive_game_setup
-        t1 = datetime(2024, 1, 1, tzinfo=UTC)
-        t2 = t1 + timedelta(days=1)
-        _install_mod(
-            engine,
-            game_id,
-            "Earlier",
-            "Earlier.zip",
-            staging,
-            {"mods/f.txt": b"e"},
-            installed_at=t1,
-        )
-        _install_mod(
-            engine,
-            game_id,
-            "Later",
-            "Later.zip",
-            staging,
-            {"mods/f.txt": b"l"},
-            installed_at=t2,
-        )
-
-        r = client.get("/api/v1/conflicts/", params={"game_name": game_name})
-        pair = r.json()["conflict_pairs"][0]
-        assert pair["winner"] == "Later"
-
 
 class TestBetweenConflicts:
     def test_no_overlap(self, client, archive_game_setup, engine):
@@ -429,12 +425,12 @@ class TestBetweenConflicts:
 
     def test_missing_source_archive_returns_422(self, client, archive_game_setup, engine):
         game_name, _, staging, game_id = archive_game_setup
-        id_a = _install_mod(engine, game_id, "ModA", "ModA.zip", staging, {"mods/a.txt": b"a"})
         with Session(engine) as s:
+            mod_a = _build_installed_mod(game_id, "ModA", "ModA.zip", staging, {"mods/a.txt": b"a"})
             mod_b = InstalledMod(game_id=game_id, name="NoArchive", source_archive="")
-            s.add(mod_b)
+            s.add_all([mod_a, mod_b])
             s.commit()
-            id_b = mod_b.id
+            id_a, id_b = mod_a.id, mod_b.id
 
         r = client.get(
             "/api/v1/conflicts/between",
@@ -444,17 +440,17 @@ class TestBetweenConflicts:
 
     def test_corrupt_archive_returns_422(self, client, archive_game_setup, engine):
         game_name, _, staging, game_id = archive_game_setup
-        id_a = _install_mod(engine, game_id, "ModA", "ModA.zip", staging, {"mods/a.txt": b"a"})
         (staging / "Corrupt.zip").write_bytes(b"not a zip")
         with Session(engine) as s:
+            mod_a = _build_installed_mod(game_id, "ModA", "ModA.zip", staging, {"mods/a.txt": b"a"})
             mod_b = InstalledMod(
                 game_id=game_id,
                 name="CorruptMod",
                 source_archive="Corrupt.zip",
             )
-            s.add(mod_b)
+            s.add_all([mod_a, mod_b])
             s.commit()
-            id_b = mod_b.id
+            id_a, id_b = mod_a.id, mod_b.id
 
         r = client.get(
             "/api/v1/conflicts/between",
@@ -1,25 +1,25 @@
 """Tests for FOMOD wizard API endpoints."""
 
-import zipfile
 from pathlib import Path
 
 import pytest
+from fixtures.zip_blobs import write_zip
 from sqlmodel import Session
 
 from rippermod_manager.models.game import Game, GameModPath
 
 
 def _make_fomod_zip(
-    path: Path, config_xml: str, extra_files: dict[str, bytes] | None = None
+    path: Path, config_xml: bytes, extra_files: dict[str, bytes] | None = None
 ) -> None:
-    """Create a zip archive with fomod/ModuleConfig.xml and optional extra files."""
-    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED) as zf:
-        zf.writestr("fomod/ModuleConfig.xml", config_xml)
-        for name, content in (extra_files or {}).items():
-            zf.writestr(name, content)
+    """Create a zip archive with fomod/ModuleConfig.xml and optional extra files.
 
+    The archive bytes are built once per process and reused by every test.
+    """
+    write_zip(path, {"fomod/ModuleConfig.xml": config_xml, **(extra_files or {})})
 
-SIMPLE_CONFIG = """\
+
+SIMPLE_CONFIG = b"""\
 <?xml version="1.0" encoding="utf-8"?>
 <config>
   <moduleName>TestFOMOD</moduleName>
@@ -52,8 +52,8 @@ SIMPLE_CONFIG = """\
 
 
 @pytest.fixture
-def fomod_setup(tmp_path, client, engine):
-    """Create a game with a FOMOD archive."""
+def fomod_game(tmp_path, client, engine):
+    """Create the FOMOD test game with an empty staging directory."""
     game_dir = tmp_path / "game"
     game_dir.mkdir()
     staging = game_dir / "downloaded_mods"
@@ -61,19 +61,23 @@ def fomod_setup(tmp_path, client, engine):
 
     with Session(engine) as s:
         g = Game(name="FomodTestGame", domain_name="ftg", install_path=str(game_dir))
+        g.mod_paths = [GameModPath(relative_path="mods")]
         s.add(g)
-        s.flush()
-        s.add(GameModPath(game_id=g.id, relative_path="mods"))
         s.commit()
 
-    archive = staging / "TestFomod.zip"
+    return "FomodTestGame", game_dir, staging
+
+
+@pytest.fixture
+def fomod_setup(fomod_game):
+    """Create a game with a FOMOD archive."""
+    _, _, staging = fomod_game
     _make_fomod_zip(
-        archive,
+        staging / "TestFomod.zip",
         SIMPLE_CONFIG,
         extra_files={"a.txt": b"content_a", "b.txt": b"content_b"},
     )
-
-    return "FomodTestGame", game_dir, staging
+    return fomod_game
 
 
 class TestGetConfig:
@@ -92,11 +96,10 @@ class TestGetConfig:
         assert len(data["steps"][0]["groups"][0]["plugins"]) == 2
         assert data["steps"][0]["groups"][0]["type"] == "SelectExactlyOne"
 
-    def test_non_fomod_archive_returns_400(self, client, fomod_setup):
-        game_name, _, staging = fomod_setup
+    def test_non_fomod_archive_returns_400(self, client, fomod_game):
+        game_name, _, staging = fomod_game
         plain = staging / "Plain.zip"
-        with zipfile.ZipFile(plain, "w") as zf:
-            zf.writestr("readme.txt", "hello")
+        write_zip(plain, {"readme.txt": b"hello"})
 
         r = client.get(
             f"/api/v1/games/{game_name}/install/fomod/config",
@@ -104,8 +107,8 @@ class TestGetConfig:
         )
         assert r.status_code == 400
 
-    def test_missing_archive_returns_404(self, client, fomod_setup):
-        game_name, _, _ = fomod_setup
+    def test_missing_archive_returns_404(self, client, fomod_game):
+        game_name, _, _ = fomod_game
         r = client.get(
             f"/api/v1/games/{game_name}/install/fomod/config",
             params={"archive_filename": "ghost.zip"},
@@ -134,7 +137,7 @@ class TestGetConfig:
         assert plugin["type_descriptor"]["patterns"] == []
 
 
-CONDITIONAL_CONFIG = """\
+CONDITIONAL_CONFIG = b"""\
 <?xml version="1.0" encoding="utf-8"?>
 <config>
   <moduleName>ConditionalFOMOD</moduleName>
@@ -224,9 +227,8 @@ def fomod_conditional_setup(tmp_path, client, engine):
 
     with Session(engine) as s:
         g = Game(name="CondGame", domain_name="cg", install_path=str(game_dir))
+        g.mod_paths = [GameModPath(relative_path="mods")]
         s.add(g)
-        s.flush()
-        s.add(GameModPath(game_id=g.id, relative_path="mods"))
         s.commit()
 
     archive = staging / "Conditional.zip"
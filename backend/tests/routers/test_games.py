@@ -1,3 +1,18 @@
+import pytest
+
+
+@pytest.fixture(scope="module")
+def fake_cp_install(tmp_path_factory):
+    """Read-only Cyberpunk install tree with the exe and two mod dirs, built once per module."""
+    root = tmp_path_factory.mktemp("cp_install")
+    exe_dir = root / "bin" / "x64"
+    exe_dir.mkdir(parents=True)
+    (exe_dir / "Cyberpunk2077.exe").touch()
+    (root / "mods").mkdir()
+    (root / "archive" / "pc" / "mod").mkdir(parents=True)
+    return root
+
+
 class TestListGames:
     def test_empty(self, client):
         r = client.get("/api/v1/games/")
@@ -6,45 +21,42 @@ class TestListGames:
 
 
 class TestCreateGame:
-    def test_success(self, client):
-        r = client.post(
-            "/api/v1/games/",
-            json={
-                "name": "TestGame",
-                "domain_name": "testgame",
-                "install_path": "/games/test",
-            },
-        )
+    @pytest.mark.parametrize(
+        "payload,expected_paths",
+        [
+            pytest.param(
+                {"name": "TestGame", "domain_name": "testgame", "install_path": "/games/test"},
+                0,
+                id="no_paths",
+            ),
+            pytest.param(
+                {
+                    "name": "Cyberpunk 2077",
+                    "domain_name": "cyberpunk2077",
+                    "install_path": "/games/cp2077",
+                },
+                7,
+                id="auto_cyberpunk_paths",
+            ),
+            pytest.param(
+                {
+                    "name": "Custom",
+                    "domain_name": "custom",
+                    "install_path": "/games/custom",
+                    "mod_paths": [{"relative_path": "mods", "description": "Main"}],
+                },
+                1,
+                id="custom_paths",
+            ),
+        ],
+    )
+    def test_success(self, client, payload, expected_paths):
+        r = client.post("/api/v1/games/", json=payload)
         assert r.status_code == 201
         data = r.json()
-        assert data["name"] == "TestGame"
-        assert data["domain_name"] == "testgame"
-
-    def test_auto_cyberpunk_paths(self, client):
-        r = client.post(
-            "/api/v1/games/",
-            json={
-                "name": "Cyberpunk 2077",
-                "domain_name": "cyberpunk2077",
-                "install_path": "/games/cp2077",
-            },
-        )
-        assert r.status_code == 201
-        paths = r.json()["mod_paths"]
-        assert len(paths) == 7
-
-    def test_custom_paths(self, client):
-        r = client.post(
-            "/api/v1/games/",
-            json={
-                "name": "Custom",
-                "domain_name": "custom",
-                "install_path": "/games/custom",
-                "mod_paths": [{"relative_path": "mods", "description": "Main"}],
-            },
-        )
-        assert r.status_code == 201
-        assert len(r.json()["mod_paths"]) == 1
+        assert data["name"] == payload["name"]
+        assert data["domain_name"] == payload["domain_name"]
+        assert len(data["mod_paths"]) == expected_paths
 
     def test_duplicate_upserts(self, client):
         payload = {
@@ -62,11 +74,8 @@ class TestCreateGame:
 
 
 class TestGetGame:
-    def test_found(self, client):
-        client.post(
-            "/api/v1/games/",
-            json={"name": "G1", "domain_name": "g1", "install_path": "/g1"},
-        )
+    def test_found(self, client, make_game):
+        make_game(name="G1", domain_name="g1", install_path="/g1")
         r = client.get("/api/v1/games/G1")
         assert r.status_code == 200
         assert r.json()["name"] == "G1"
@@ -89,19 +98,10 @@ class TestValidatePath:
         assert data["found_mod_dirs"] == []
         assert "not found" in data["warning"].lower()
 
-    def test_valid_path_with_exe(self, client, tmp_path):
-        # Create a fake Cyberpunk install
-        exe_dir = tmp_path / "bin" / "x64"
-        exe_dir.mkdir(parents=True)
-        (exe_dir / "Cyberpunk2077.exe").touch()
-
-        # Create some mod dirs
-        (tmp_path / "mods").mkdir()
-        (tmp_path / "archive" / "pc" / "mod").mkdir(parents=True)
-
+    def test_valid_path_with_exe(self, client, fake_cp_install):
         r = client.post(
             "/api/v1/games/validate-path",
-            json={"install_path": str(tmp_path)},
+            json={"install_path": str(fake_cp_install)},
         )
         assert r.status_code == 200
         data = r.json()
@@ -135,11 +135,8 @@ class TestValidatePath:
 
 
 class TestDeleteGame:
-    def test_success(self, client):
-        client.post(
-            "/api/v1/games/",
-            json={"name": "ToDelete", "domain_name": "del", "install_path": "/d"},
-        )
+    def test_success(self, client, make_game):
+        make_game(name="ToDelete", domain_name="del", install_path="/d")
         r = client.delete("/api/v1/games/ToDelete")
         assert r.status_code == 204
 
@@ -1,7 +1,8 @@
-import zipfile
 from pathlib import Path
 
 import pytest
+from fixtures.zip_blobs import write_zip
+from sqlmodel import Session, select
 
 from rippermod_manager.models.game import Game, GameModPath
 from rippermod_manager.models.install import InstalledMod
@@ -9,16 +10,12 @@ from rippermod_manager.models.install import InstalledMod
 
 def _make_zip(path: Path, files: dict[str, bytes]) -> None:
     """Create a zip archive at *path* containing the given files."""
-    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED) as zf:
-        for name, content in files.items():
-            zf.writestr(name, content)
+    write_zip(path, files)
 
 
 @pytest.fixture
 def game_setup(tmp_path, client, engine):
     """Create a game with a filesystem structure and return (game_name, game_dir, staging_dir)."""
-    from sqlmodel import Session
-
     game_dir = tmp_path / "game"
     game_dir.mkdir()
     staging = game_dir / "downloaded_mods"
@@ -26,9 +23,8 @@ def game_setup(tmp_path, client, engine):
 
     with Session(engine) as s:
         g = Game(name="InstallGame", domain_name="ig", install_path=str(game_dir))
+        g.mod_paths = [GameModPath(relative_path="mods")]
         s.add(g)
-        s.flush()
-        s.add(GameModPath(game_id=g.id, relative_path="mods"))
         s.commit()
 
     return "InstallGame", game_dir, staging
@@ -36,8 +32,6 @@ def game_setup(tmp_path, client, engine):
 
 class TestListAvailableArchives:
     def test_returns_empty_when_no_staging_dir(self, client, engine, tmp_path):
-        from sqlmodel import Session
-
         game_dir = tmp_path / "nodl"
         game_dir.mkdir()
 
@@ -62,10 +56,6 @@ class TestListAvailableArchives:
         assert "mod_a.zip" in names
         assert "not_an_archive.txt" not in names
 
-    def test_game_not_found_returns_404(self, client):
-        r = client.get("/api/v1/games/NoSuchGame/install/available")
-        assert r.status_code == 404
-
     def test_parses_nexus_filename(self, client, game_setup):
         game_name, _, staging = game_setup
         (staging / "CET-107-1-37-1-1759193708.zip").write_bytes(b"fake")
@@ -84,13 +74,8 @@ class TestListInstalledMods:
         assert r.status_code == 200
         assert r.json() == []
 
-    def test_game_not_found_returns_404(self, client):
-        r = client.get("/api/v1/games/Missing/install/installed")
-        assert r.status_code == 404
-
     def test_returns_installed_mods(self, client, game_setup, engine):
         game_name, _, _ = game_setup
-        from sqlmodel import Session, select
 
         with Session(engine) as s:
             game = s.exec(select(Game).where(Game.name == game_name)).first()
@@ -129,13 +114,6 @@ class TestInstallEndpoint:
         )
         assert r.status_code == 404
 
-    def test_game_not_found_returns_404(self, client):
-        r = client.post(
-            "/api/v1/games/Missing/install/",
-            json={"archive_filename": "mod.zip"},
-        )
-        assert r.status_code == 404
-
     def test_duplicate_install_returns_409(self, client, game_setup):
         game_name, _, staging = game_setup
         archive = staging / "DupMod.zip"
@@ -204,8 +182,6 @@ class TestUninstallEndpoint:
         mod_id = install_resp.json()["installed_mod_id"]
 
         # Create a second game
-        from sqlmodel import Session
-
         game_dir2 = tmp_path / "game2"
         game_dir2.mkdir()
         with Session(engine) as s:
@@ -218,7 +194,7 @@ class TestUninstallEndpoint:
 
 
 class TestToggleEndpoint:
-    def test_toggle_disables_mod(self, client, game_setup):
+    def test_toggle_disables_then_re_enables_mod(self, client, game_setup):
         game_name, _, staging = game_setup
         archive = staging / "TogMod.zip"
         _make_zip(archive, {"mods/tog.txt": b"t"})
@@ -227,25 +203,15 @@ class TestToggleEndpoint:
             json={"archive_filename": "TogMod.zip"},
         )
         mod_id = install_resp.json()["installed_mod_id"]
+        toggle_url = f"/api/v1/games/{game_name}/install/installed/{mod_id}/toggle"
 
-        r = client.patch(f"/api/v1/games/{game_name}/install/installed/{mod_id}/toggle")
+        r = client.patch(toggle_url)
         assert r.status_code == 200
         data = r.json()
         assert data["disabled"] is True
         assert data["files_affected"] == 1
 
-    def test_toggle_re_enables_mod(self, client, game_setup):
-        game_name, _, staging = game_setup
-        archive = staging / "TogBack.zip"
-        _make_zip(archive, {"mods/back.txt": b"x"})
-        install_resp = client.post(
-            f"/api/v1/games/{game_name}/install/",
-            json={"archive_filename": "TogBack.zip"},
-        )
-        mod_id = install_resp.json()["installed_mod_id"]
-
-        client.patch(f"/api/v1/games/{game_name}/install/installed/{mod_id}/toggle")
-        r = client.patch(f"/api/v1/games/{game_name}/install/installed/{mod_id}/toggle")
+        r = client.patch(toggle_url)
         assert r.status_code == 200
         assert r.json()["disabled"] is False
 
@@ -298,9 +264,24 @@ class TestConflictsEndpoint:
         )
         assert r.status_code == 404
 
-    def test_game_not_found_returns_404(self, client):
-        r = client.get(
-            "/api/v1/games/NoGame/install/conflicts",
-            params={"archive_filename": "any.zip"},
-        )
+
+class TestGameNotFound:
+    @pytest.mark.parametrize(
+        "method,url,kwargs",
+        [
+            pytest.param("GET", "install/available", {}, id="available"),
+            pytest.param("GET", "install/installed", {}, id="installed"),
+            pytest.param(
+                "POST", "install/", {"json": {"archive_filename": "mod.zip"}}, id="install"
+            ),
+            pytest.param(
+                "GET",
+                "install/conflicts",
+                {"params": {"archive_filename": "any.zip"}},
+                id="conflicts",
+            ),
+        ],
+    )
+    def test_returns_404(self, client, method, url, kwargs):
+        r = client.request(method, f"/api/v1/games/NoSuchGame/{url}", **kwargs)
         assert r.status_code == 404
@@ -1,4 +1,5 @@
-from datetime import UTC, datetime
+import itertools
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from sqlmodel import Session, select
@@ -15,36 +16,38 @@ def game_setup(tmp_path, client, engine):
 
     with Session(engine) as s:
         g = Game(name="LoadOrderGame", domain_name="cyberpunk2077", install_path=str(game_dir))
+        g.mod_paths = [GameModPath(relative_path="archive/pc/mod")]
         s.add(g)
-        s.flush()
-        s.add(GameModPath(game_id=g.id, relative_path="archive/pc/mod"))
         s.commit()
 
     return "LoadOrderGame", game_dir
 
 
-def _add_mod(engine, game_name, mod_name, archive_filenames, *, game_dir=None, disabled=False):
-    """Insert an InstalledMod with archive files via a fresh session."""
-    with Session(engine) as s:
-        g = s.exec(select(Game).where(Game.name == game_name)).one()
-        mod = InstalledMod(
-            game_id=g.id,
-            name=mod_name,
-            disabled=disabled,
-            installed_at=datetime.now(UTC),
-        )
-        s.add(mod)
-        s.flush()
-        for fn in archive_filenames:
-            rel = f"archive/pc/mod/{fn}"
-            s.add(InstalledModFile(installed_mod_id=mod.id, relative_path=rel))
-            if game_dir is not None:
-                fp = game_dir / "archive" / "pc" / "mod" / fn
-                fp.parent.mkdir(parents=True, exist_ok=True)
-                fp.write_bytes(b"data")
-        s.commit()
-        s.refresh(mod)
-        return mod.id
+# Deterministic, strictly increasing install times for _add_mod
+_BASE_INSTALLED_AT = datetime(2024, 1, 1, tzinfo=UTC)
+_install_seq = itertools.count()
+
+
+def _add_mod(session, game_name, mod_name, archive_filenames, *, game_dir=None, disabled=False):
+    """Add an InstalledMod with archive files to *session* and flush; the caller commits."""
+    g = session.exec(select(Game).where(Game.name == game_name)).one()
+    mod = InstalledMod(
+        game_id=g.id,
+        name=mod_name,
+        disabled=disabled,
+        installed_at=_BASE_INSTALLED_AT + timedelta(seconds=next(_install_seq)),
+    )
+    session.add(mod)
+    session.flush()
+    for fn in archive_filenames:
+        rel = f"archive/pc/mod/{fn}"
+        session.add(InstalledModFile(installed_mod_id=mod.id, relative_path=rel))
+        if game_dir is not None:
+            fp = game_dir / "archive" / "pc" / "mod" / fn
+            fp.parent.mkdir(parents=True, exist_ok=True)
+            fp.write_bytes(b"data")
+    session.flush()
+    return mod.id
 
 
 class TestLoadOrderEndpoint:
@@ -61,10 +64,11 @@ class TestLoadOrderEndpoint:
         assert data["load_order"] == []
         assert data["conflicts"] == []
 
-    def test_returns_sorted_entries(self, client, engine, game_setup):
+    def test_returns_sorted_entries(self, client, session, game_setup):
         game_name, _ = game_setup
-        _add_mod(engine, game_name, "ModZ", ["zzz.archive"])
-        _add_mod(engine, game_name, "ModA", ["aaa.archive"])
+        _add_mod(session, game_name, "ModZ", ["zzz.archive"])
+        _add_mod(session, game_name, "ModA", ["aaa.archive"])
+        session.commit()
 
         r = client.get(f"/api/v1/games/{game_name}/load-order/")
         assert r.status_code == 200
@@ -82,10 +86,11 @@ class TestPreferPreviewEndpoint:
         )
         assert r.status_code == 404
 
-    def test_returns_dry_run_true(self, client, engine, game_setup):
+    def test_returns_dry_run_true(self, client, session, game_setup):
         game_name, game_dir = game_setup
-        w_id = _add_mod(engine, game_name, "Winner", ["aaa.archive"], game_dir=game_dir)
-        l_id = _add_mod(engine, game_name, "Loser", ["bbb.archive"], game_dir=game_dir)
+        w_id = _add_mod(session, game_name, "Winner", ["aaa.archive"], game_dir=game_dir)
+        l_id = _add_mod(session, game_name, "Loser", ["bbb.archive"], game_dir=game_dir)
+        session.commit()
 
         r = client.post(
             f"/api/v1/games/{game_name}/load-order/prefer/preview",
@@ -96,9 +101,10 @@ class TestPreferPreviewEndpoint:
         assert data["dry_run"] is True
         assert data["success"] is True
 
-    def test_unknown_mod_id_returns_404(self, client, engine, game_setup):
+    def test_unknown_mod_id_returns_404(self, client, session, game_setup):
         game_name, _ = game_setup
-        w_id = _add_mod(engine, game_name, "Winner", ["aaa.archive"])
+        w_id = _add_mod(session, game_name, "Winner", ["aaa.archive"])
+        session.commit()
 
         r = client.post(
             f"/api/v1/games/{game_name}/load-order/prefer/preview",
@@ -106,9 +112,10 @@ class TestPreferPreviewEndpoint:
         )
         assert r.status_code == 404
 
-    def test_same_mod_id_returns_400(self, client, engine, game_setup):
+    def test_same_mod_id_returns_400(self, client, session, game_setup):
         game_name, _ = game_setup
-        w_id = _add_mod(engine, game_name, "SomeMod", ["aaa.archive"])
+        w_id = _add_mod(session, game_name, "SomeMod", ["aaa.archive"])
+        session.commit()
 
         r = client.post(
             f"/api/v1/games/{game_name}/load-order/prefer/preview",
@@ -116,10 +123,11 @@ class TestPreferPreviewEndpoint:
         )
         assert r.status_code == 400
 
-    def test_disabled_mod_returns_400(self, client, engine, game_setup):
+    def test_disabled_mod_returns_400(self, client, session, game_setup):
         game_name, _ = game_setup
-        w_id = _add_mod(engine, game_name, "Winner", ["aaa.archive"])
-        l_id = _add_mod(engine, game_name, "Loser", ["bbb.archive"], disabled=True)
+        w_id = _add_mod(session, game_name, "Winner", ["aaa.archive"])
+        l_id = _add_mod(session, game_name, "Loser", ["bbb.archive"], disabled=True)
+        session.commit()
 
         r = client.post(
             f"/api/v1/games/{game_name}/load-order/prefer/preview",
@@ -136,10 +144,11 @@ class TestPreferEndpoint:
         )
         assert r.status_code == 404
 
-    def test_adds_preference_and_writes_modlist(self, client, engine, game_setup):
+    def test_adds_preference_and_writes_modlist(self, client, session, game_setup):
         game_name, game_dir = game_setup
-        w_id = _add_mod(engine, game_name, "Winner", ["bbb.archive"], game_dir=game_dir)
-        l_id = _add_mod(engine, game_name, "Loser", ["aaa.archive"], game_dir=game_dir)
+        w_id = _add_mod(session, game_name, "Winner", ["bbb.archive"], game_dir=game_dir)
+        l_id = _add_mod(session, game_name, "Loser", ["aaa.archive"], game_dir=game_dir)
+        session.commit()
 
         r = client.post(
             f"/api/v1/games/{game_name}/load-order/prefer",
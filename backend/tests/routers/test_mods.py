@@ -1,5 +1,9 @@
-from unittest.mock import patch
+from sqlmodel import Session
 
+from rippermod_manager.matching import correlator
+from rippermod_manager.models.game import Game, GameModPath
+from rippermod_manager.models.mod import ModFile, ModGroup
+from rippermod_manager.scanner import service as scanner_service
 from rippermod_manager.schemas.mod import CorrelateResult, ScanResult
 
 
@@ -8,21 +12,13 @@ class TestListModGroups:
         r = client.get("/api/v1/games/NoGame/mods/")
         assert r.status_code == 404
 
-    def test_empty(self, client):
-        client.post(
-            "/api/v1/games/",
-            json={"name": "G", "domain_name": "g", "install_path": "/g"},
-        )
+    def test_empty(self, client, make_game):
+        make_game(name="G", domain_name="g", install_path="/g")
         r = client.get("/api/v1/games/G/mods/")
         assert r.status_code == 200
         assert r.json() == []
 
     def test_with_groups(self, client, engine):
-        from sqlmodel import Session
-
-        from rippermod_manager.models.game import Game, GameModPath
-        from rippermod_manager.models.mod import ModFile, ModGroup
-
         with Session(engine) as s:
             game = Game(name="G", domain_name="g", install_path="/g")
             s.add(game)
@@ -49,16 +45,11 @@ class TestListModGroups:
 
 
 class TestScanMods:
-    def test_scan_mock(self, client):
-        client.post(
-            "/api/v1/games/",
-            json={"name": "G", "domain_name": "g", "install_path": "/g"},
-        )
-        with patch(
-            "rippermod_manager.scanner.service.scan_game_mods",
-            return_value=ScanResult(files_found=5, groups_created=2, new_files=3),
-        ):
-            r = client.post("/api/v1/games/G/mods/scan")
+    def test_scan_mock(self, client, make_game, monkeypatch):
+        make_game(name="G", domain_name="g", install_path="/g")
+        result = ScanResult(files_found=5, groups_created=2, new_files=3)
+        monkeypatch.setattr(scanner_service, "scan_game_mods", lambda *a, **kw: result)
+        r = client.post("/api/v1/games/G/mods/scan")
         assert r.status_code == 200
         assert r.json()["files_found"] == 5
 
@@ -68,15 +59,10 @@ class TestScanMods:
 
 
 class TestCorrelateMods:
-    def test_correlate_mock(self, client):
-        client.post(
-            "/api/v1/games/",
-            json={"name": "G", "domain_name": "g", "install_path": "/g"},
-        )
-        with patch(
-            "rippermod_manager.matching.correlator.correlate_game_mods",
-            return_value=CorrelateResult(total_groups=10, matched=7, unmatched=3),
-        ):
-            r = client.post("/api/v1/games/G/mods/correlate")
+    def test_correlate_mock(self, client, make_game, monkeypatch):
+        make_game(name="G", domain_name="g", install_path="/g")
+        result = CorrelateResult(total_groups=10, matched=7, unmatched=3)
+        monkeypatch.setattr(correlator, "correlate_game_mods", lambda *a, **kw: result)
+        r = client.post("/api/v1/games/G/mods/correlate")
         assert r.status_code == 200
         assert r.json()["matched"] == 7
@@ -1,36 +1,24 @@
-import zipfile
 from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
-
-from rippermod_manager.models.game import Game, GameModPath
+from fixtures.zip_blobs import write_zip
 
 
 def _make_zip(path: Path, files: dict[str, bytes]) -> None:
     """Create a zip archive at *path* containing the given files."""
-    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED) as zf:
-        for name, content in files.items():
-            zf.writestr(name, content)
+    write_zip(path, files)
 
 
 @pytest.fixture
-def game_setup(tmp_path, client, engine):
+def game_setup(tmp_path, client, make_game):
     """Create a game with staging directory; return (game_name, game_dir, staging)."""
-    from sqlmodel import Session
-
     game_dir = tmp_path / "game"
-    game_dir.mkdir()
     staging = game_dir / "downloaded_mods"
-    staging.mkdir()
-
-    with Session(engine) as s:
-        g = Game(name="ProfilesGame", domain_name="prg", install_path=str(game_dir))
-        s.add(g)
-        s.flush()
-        s.add(GameModPath(game_id=g.id, relative_path="mods"))
-        s.commit()
-
+    staging.mkdir(parents=True)
+    make_game(
+        name="ProfilesGame", domain_name="prg", install_path=str(game_dir), mod_paths=["mods"]
+    )
     return "ProfilesGame", game_dir, staging
 
 
@@ -1,3 +1,7 @@
+from sqlmodel import select, text
+
+from rippermod_manager.models.install import InstalledMod, InstalledModFile
+from rippermod_manager.models.mod import ModGroup
 from rippermod_manager.scanner.service import compute_hash, scan_game_mods
 
 
@@ -98,3 +102,48 @@ class TestScanGameMods:
         )
         result = scan_game_mods(game, session)
         assert result.groups_created >= 1
+
+    def test_links_installed_mod_by_file_overlap(self, tmp_path, session, make_game):
+        mod_dir = tmp_path / "archive" / "pc" / "mod"
+        mod_dir.mkdir(parents=True)
+        (mod_dir / "weather_enhanced.archive").write_text("data1")
+        (mod_dir / "police_overhaul.archive").write_text("data2")
+        game = make_game(
+            install_path=str(tmp_path),
+            mod_paths=["archive/pc/mod"],
+        )
+        im = InstalledMod(game_id=game.id, name="Weather Enhanced")
+        im.files = [InstalledModFile(relative_path="archive/pc/mod/weather_enhanced.archive")]
+        session.add(im)
+        session.flush()
+
+        scan_game_mods(game, session)
+
+        assert im.mod_group_id is not None
+        group = session.exec(select(ModGroup).where(ModGroup.id == im.mod_group_id)).one()
+        assert [f.filename for f in group.files] == ["weather_enhanced.archive"]
+
+    def test_owner_lookup_spans_path_batches(self, tmp_path, session, make_game, monkeypatch):
+        monkeypatch.setattr("rippermod_manager.scanner.service._PATH_QUERY_BATCH", 1)
+        mod_dir = tmp_path / "archive" / "pc" / "mod"
+        mod_dir.mkdir(parents=True)
+        for name in ("aaa_first.archive", "weather_enhanced.archive", "zzz_last.archive"):
+            (mod_dir / name).write_text(name)
+        game = make_game(install_path=str(tmp_path), mod_paths=["archive/pc/mod"])
+        im = InstalledMod(game_id=game.id, name="Weather Enhanced")
+        im.files = [InstalledModFile(relative_path="archive/pc/mod/weather_enhanced.archive")]
+        session.add(im)
+        session.flush()
+
+        scan_game_mods(game, session)
+
+        group = session.exec(select(ModGroup).where(ModGroup.id == im.mod_group_id)).one()
+        assert [f.filename for f in group.files] == ["weather_enhanced.archive"]
+
+    def test_owner_lookup_uses_covering_index(self, session):
+        stmt = select(InstalledModFile.relative_path, InstalledModFile.installed_mod_id).where(
+            InstalledModFile.relative_path.in_(["a.archive", "b.archive"])
+        )
+        compiled = stmt.compile(session.get_bind(), compile_kwargs={"literal_binds": True})
+        plan = session.exec(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+        assert any("COVERING INDEX ix_installed_mod_files_path_mod" in row[-1] for row in plan)